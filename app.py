@@ -1,10 +1,27 @@
 from argparse import ArgumentParser
 
-from libraries.preprocess.runner import run_preprocess
+from libraries.preprocess.image import PngEncodingProfile
+from libraries.preprocess.runner import (
+    run_changed_preprocess,
+    run_image_duplicate_report,
+    run_preprocess,
+    run_snapshot_preprocess,
+)
 from libraries.puller.runner import run_token_puller
 
-OPERATION_DICT = {"preprocess": run_preprocess, "pull_token": run_token_puller}
+OPERATION_DICT = {
+    "image_duplicates": run_image_duplicate_report,
+    "preprocess": run_preprocess,
+    "pull_token": run_token_puller,
+    "snapshot": run_snapshot_preprocess,
+}
 """The dictionary of operations application supports."""
+PNG_PROFILE_DICT = {
+    "fast": PngEncodingProfile.fast,
+    "max": PngEncodingProfile.max,
+    "palette": PngEncodingProfile.palette,
+}
+"""The dictionary of profiles to encode the PNG images of the preprocessing."""
 
 
 if __name__ == "__main__":
@@ -15,5 +32,33 @@ if __name__ == "__main__":
         choices=OPERATION_DICT.keys(),
         help="The operation to run.",
     )
+    parser.add_argument(
+        "--changed-since",
+        type=str,
+        default=None,
+        metavar="REF",
+        help="Preprocess only the directories changed since the git reference.",
+    )
+    parser.add_argument(
+        "--png-profile",
+        type=str,
+        default=None,
+        choices=PNG_PROFILE_DICT.keys(),
+        help="The profile to encode the PNG images of the preprocessing. (max by "
+        "default)",
+    )
     args = parser.parse_args()
-    OPERATION_DICT[args.operation]()
+    if args.operation != "preprocess":
+        if args.changed_since is not None:
+            parser.error(
+                "--changed-since is only supported by the preprocess operation"
+            )
+        if args.png_profile is not None:
+            parser.error("--png-profile is only supported by the preprocess operation")
+        OPERATION_DICT[args.operation]()
+    else:
+        profile = PNG_PROFILE_DICT[args.png_profile or "max"]()
+        if args.changed_since is None:
+            run_preprocess(profile=profile)
+        else:
+            run_changed_preprocess(args.changed_since, profile)
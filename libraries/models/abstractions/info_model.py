@@ -1,14 +1,23 @@
 from abc import ABCMeta
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
 from json import loads
+from os import cpu_count
 from pathlib import Path
-from typing import Self
+from typing import Self, Type
+
+from pydantic import VERSION as PYDANTIC_VERSION
 
 from libraries.models.terminals.id import Id
 from libraries.models.image_info import ImageInfo
 from libraries.models.terminals.info_category import InfoCategory
 from libraries.models.terminals.tag_list import TagList
 from libraries.models.templates.camelcase_model import CamelCaseModel
-from libraries.utils.file import search
+from libraries.utils.cache import FileCache, get_cache_dir, hash_files
+from libraries.utils.file import INFO_FILE_DEPTH, search
+
+PARALLEL_READ_THRESHOLD: int = 256
+"""The minimum number of files to read them with a process pool."""
 
 
 class InfoModel(CamelCaseModel, metaclass=ABCMeta):
@@ -36,27 +45,140 @@ class InfoModel(CamelCaseModel, metaclass=ABCMeta):
         raise NotImplementedError
 
     @classmethod
-    def __read_info(cls, file_path: Path) -> tuple[Self, Path]:
-        """Reads the information from the file.
-
-        Args:
-            file_path: the path of the file.
+    def get_info_path_list(cls) -> list[Path]:
+        """Gets the list of information file paths.
 
         Returns:
-            The information.
+            The list of information file paths.
         """
-        with open(file_path, "r") as fp:
-            return cls.model_validate(loads(fp.read())), file_path
+        return search(
+            cls.get_info_category().get_model_dir_path(),
+            r"^info\.json$",
+            INFO_FILE_DEPTH,
+        )
 
     @classmethod
-    def get_info_list(cls) -> list[tuple[Self, Path]]:
+    def get_info_list(
+        cls, max_workers: int | None = None, use_cache: bool = True
+    ) -> list[tuple[Self, Path]]:
         """Gets the list of information.
 
+        Args:
+            max_workers: The maximum number of processes to read the information.
+            use_cache: Whether to use the persistent cache of validated information.
+
         Returns:
             The list of information.
         """
-        info_category = cls.get_info_category()
-        return [
-            cls.__read_info(file_path)
-            for file_path in search(info_category.get_model_dir_path(), r"^info\.json$")
-        ]
+        return read_info_list(
+            [(cls, file_path) for file_path in cls.get_info_path_list()],
+            max_workers,
+            use_cache,
+        )
+
+
+@cache
+def _get_model_fingerprint() -> str:
+    """Gets the fingerprint of the model definitions and their loaders.
+
+    Returns:
+        The fingerprint of the model definitions and their loaders.
+
+    Notes:
+        The cached information is invalidated if any source of the models or the
+        utilities loading them, or the version of pydantic is changed.
+    """
+    libraries_dir = Path(__file__).resolve().parent.parent.parent
+    sources = [
+        source
+        for package in ["models", "utils"]
+        for source in sorted(libraries_dir.joinpath(package).rglob("*.py"))
+    ]
+    return f"{PYDANTIC_VERSION}:{hash_files(sources)}"
+
+
+def _read_info[T: InfoModel](model_type: Type[T], file_path: Path) -> tuple[T, Path]:
+    """Reads the information from the file.
+
+    Args:
+        model_type: The type of the model.
+        file_path: The path of the file.
+
+    Returns:
+        The information.
+    """
+    with open(file_path, "r") as fp:
+        return model_type.model_validate(loads(fp.read())), file_path
+
+
+def read_info_list(
+    targets: list[tuple[Type[InfoModel], Path]],
+    max_workers: int | None = None,
+    use_cache: bool = True,
+) -> list[tuple[InfoModel, Path]]:
+    """Reads the information from the files, in parallel if there are many of them.
+
+    Args:
+        targets: The list of model types and file paths to read.
+        max_workers: The maximum number of processes to read the information.
+            (If it is not given, the number of CPUs is used.)
+        use_cache: Whether to use the persistent cache of validated information.
+            (It is not used either if `get_cache_dir` disables it.)
+
+    Returns:
+        The list of information in the same order as the targets.
+
+    Notes:
+        Only the files changed since the last read are validated again if the
+        cache is used. JSON decoding and validation are spread across a process
+        pool only if the number of them is not less than `PARALLEL_READ_THRESHOLD`.
+    """
+    if not use_cache or (cache_dir := get_cache_dir()) is None:
+        return _read_info_list(targets, max_workers)
+    caches: dict[InfoCategory, FileCache] = dict()
+    for model_type, _ in targets:
+        if (category := model_type.get_info_category()) not in caches:
+            caches[category] = FileCache.load(
+                cache_dir.joinpath("info").joinpath(f"{category}.pickle"),
+                _get_model_fingerprint(),
+            )
+    info_list: list[tuple[InfoModel, Path] | None] = list()
+    for model_type, file_path in targets:
+        info = caches[model_type.get_info_category()].get(file_path)
+        info_list.append(None if info is None else (info, file_path))
+    missed = [idx for idx, info in enumerate(info_list) if info is None]
+    for idx, info in zip(
+        missed, _read_info_list([targets[idx] for idx in missed], max_workers)
+    ):
+        caches[targets[idx][0].get_info_category()].put(info[1], info[0])
+        info_list[idx] = info
+    for file_cache in caches.values():
+        file_cache.save()
+    return info_list
+
+
+def _read_info_list(
+    targets: list[tuple[Type[InfoModel], Path]], max_workers: int | None = None
+) -> list[tuple[InfoModel, Path]]:
+    """Reads and validates the information from the files.
+
+    Args:
+        targets: The list of model types and file paths to read.
+        max_workers: The maximum number of processes to read the information.
+
+    Returns:
+        The list of information in the same order as the targets.
+    """
+    workers = min(max_workers or cpu_count() or 1, len(targets))
+    if workers <= 1 or len(targets) < PARALLEL_READ_THRESHOLD:
+        return [_read_info(model_type, file_path) for model_type, file_path in targets]
+    model_types, file_paths = zip(*targets)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                _read_info,
+                model_types,
+                file_paths,
+                chunksize=max(1, len(targets) // (workers * 4)),
+            )
+        )
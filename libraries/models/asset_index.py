@@ -0,0 +1,172 @@
+from typing import Iterable, Self
+
+from libraries.models.asset import Asset
+from libraries.models.contract import Contract
+from libraries.models.terminals.address import Address
+from libraries.models.terminals.id import Id
+
+
+class AssetIndex:
+    """An in-memory index of asset information for lookups by ID, address and symbol.
+
+    Attributes:
+        assets: The map of asset ID and asset information.
+        contracts: The map of network ID and the map of address and the pair of
+            asset and contract information.
+        symbols: The map of contract symbol and the map of asset ID and asset
+            information.
+
+    Args:
+        assets: The asset information to index.
+    """
+
+    assets: dict[Id, Asset]
+    contracts: dict[Id, dict[Address, tuple[Asset, Contract]]]
+    symbols: dict[str, dict[Id, Asset]]
+
+    def __init__(self, assets: Iterable[Asset] = ()) -> None:
+        self.assets = dict()
+        self.contracts = dict()
+        self.symbols = dict()
+        for asset in assets:
+            self.upsert(asset)
+
+    def __contains__(self, asset_id: Id) -> bool:
+        return asset_id in self.assets
+
+    def __len__(self) -> int:
+        return len(self.assets)
+
+    @staticmethod
+    def load() -> Self:
+        """Loads the index of all asset information.
+
+        Returns:
+            The index of all asset information.
+        """
+        return AssetIndex(asset for asset, _ in Asset.get_info_list())
+
+    def get_asset(self, asset_id: Id) -> Asset | None:
+        """Gets the asset information from the asset ID.
+
+        Args:
+            asset_id: The asset ID.
+
+        Returns:
+            The asset information if it exists, otherwise None.
+        """
+        return self.assets.get(asset_id, None)
+
+    def get_asset_ids(self) -> set[Id]:
+        """Gets the set of all asset IDs.
+
+        Returns:
+            The set of all asset IDs.
+        """
+        return set(self.assets.keys())
+
+    def find(self, network_id: Id, address: Address) -> tuple[Asset, Contract] | None:
+        """Finds the asset and contract information from the network ID and address.
+
+        Args:
+            network_id: The network ID of the contract.
+            address: The address of the contract.
+
+        Returns:
+            The pair of asset and contract information if it exists, otherwise None.
+        """
+        return self.contracts.get(network_id, {}).get(address, None)
+
+    def find_asset(self, network_id: Id, address: Address) -> Asset | None:
+        """Finds the asset information from the network ID and address.
+
+        Args:
+            network_id: The network ID of the contract.
+            address: The address of the contract.
+
+        Returns:
+            The asset information if it exists, otherwise None.
+        """
+        found = self.find(network_id, address)
+        return None if found is None else found[0]
+
+    def get_assets_by_symbol(self, symbol: str) -> list[Asset]:
+        """Gets the list of asset information which has a contract with the symbol.
+
+        Args:
+            symbol: The symbol of the contract.
+
+        Returns:
+            The list of asset information sorted by asset ID.
+        """
+        assets = self.symbols.get(symbol, {})
+        return [assets[asset_id] for asset_id in sorted(assets)]
+
+    def get_contracts(self, network_id: Id) -> list[Contract]:
+        """Gets the list of contract information in the network.
+
+        Args:
+            network_id: The network ID.
+
+        Returns:
+            The list of contract information in the network.
+        """
+        return [contract for _, contract in self.contracts.get(network_id, {}).values()]
+
+    def get_duplicate_addresses(self, asset: Asset) -> list[Address]:
+        """Gets the addresses of the asset already indexed by another asset.
+
+        Args:
+            asset: The asset information to check.
+
+        Returns:
+            The list of addresses of the contracts indexed by another asset.
+        """
+        duplicate_addresses = []
+        for contract in asset.contracts:
+            found = self.find(contract.network, contract.address)
+            if found is not None and found[0].id != asset.id:
+                duplicate_addresses.append(contract.address)
+        return duplicate_addresses
+
+    def upsert(self, asset: Asset) -> None:
+        """Inserts or replaces the asset information in the index.
+
+        Args:
+            asset: The asset information to insert or replace.
+
+        Raises:
+            ValueError: If the address of any contract is already indexed by another asset.
+        """
+        if len(duplicate_addresses := self.get_duplicate_addresses(asset)) > 0:
+            raise ValueError(f"Duplicate address found: {duplicate_addresses[0]}")
+        self.remove(asset.id)
+        self.assets[asset.id] = asset
+        for contract in asset.contracts:
+            self.contracts.setdefault(contract.network, {})[contract.address] = (
+                asset,
+                contract,
+            )
+            self.symbols.setdefault(contract.symbol, {})[asset.id] = asset
+
+    def remove(self, asset_id: Id) -> Asset | None:
+        """Removes the asset information from the index.
+
+        Args:
+            asset_id: The asset ID to remove.
+
+        Returns:
+            The removed asset information if it exists, otherwise None.
+        """
+        if (asset := self.assets.pop(asset_id, None)) is None:
+            return None
+        for contract in asset.contracts:
+            if (network_contracts := self.contracts.get(contract.network)) is not None:
+                network_contracts.pop(contract.address, None)
+                if len(network_contracts) == 0:
+                    del self.contracts[contract.network]
+            if (symbol_assets := self.symbols.get(contract.symbol)) is not None:
+                symbol_assets.pop(asset_id, None)
+                if len(symbol_assets) == 0:
+                    del self.symbols[contract.symbol]
+        return asset
@@ -0,0 +1,78 @@
+from pathlib import Path
+from typing import Self, Type
+
+from libraries.models.abstractions.info_model import InfoModel, read_info_list
+from libraries.models.asset import Asset
+from libraries.models.network import Network
+from libraries.models.protocol import Protocol
+
+
+class Catalog:
+    """The whole catalog of asset, network and protocol information.
+
+    Attributes:
+        assets: The list of asset information and its file path.
+        networks: The list of network information and its file path.
+        protocols: The list of protocol information and its file path.
+
+    Args:
+        assets: The list of asset information and its file path.
+        networks: The list of network information and its file path.
+        protocols: The list of protocol information and its file path.
+    """
+
+    assets: list[tuple[Asset, Path]]
+    networks: list[tuple[Network, Path]]
+    protocols: list[tuple[Protocol, Path]]
+
+    def __init__(
+        self,
+        assets: list[tuple[Asset, Path]],
+        networks: list[tuple[Network, Path]],
+        protocols: list[tuple[Protocol, Path]],
+    ) -> None:
+        self.assets = assets
+        self.networks = networks
+        self.protocols = protocols
+
+    @staticmethod
+    def load(max_workers: int | None = None) -> Self:
+        """Loads all information of assets, networks and protocols in one pass.
+
+        Args:
+            max_workers: The maximum number of processes to read the information.
+
+        Returns:
+            The catalog of all information.
+        """
+        targets = [
+            (model_type, file_path)
+            for model_type in [Asset, Network, Protocol]
+            for file_path in model_type.get_info_path_list()
+        ]
+        info_list = read_info_list(targets, max_workers)
+        return Catalog(
+            assets=[info for info in info_list if isinstance(info[0], Asset)],
+            networks=[info for info in info_list if isinstance(info[0], Network)],
+            protocols=[info for info in info_list if isinstance(info[0], Protocol)],
+        )
+
+    def get_info_list[T: InfoModel](self, model_type: Type[T]) -> list[tuple[T, Path]]:
+        """Gets the list of information of the model type.
+
+        Args:
+            model_type: The type of the model.
+
+        Returns:
+            The list of information of the model type and its file path.
+
+        Raises:
+            ValueError: If the model type is not in the catalog.
+        """
+        if model_type is Asset:
+            return self.assets
+        elif model_type is Network:
+            return self.networks
+        elif model_type is Protocol:
+            return self.protocols
+        raise ValueError(f"Unknown model type: {model_type}")
@@ -13,6 +13,10 @@ class ImageInfo(CamelCaseModel):
         png32: whether the image in PNG format with 32x32 pixels exists.
         png64: whether the image in PNG format with 64x64 pixels exists.
         svg: whether the image in SVG format exists.
+
+    Notes:
+        The name of each field is the value of its image type, so that each flag is
+        accessed directly by the image type.
     """
 
     png128: bool
@@ -36,6 +40,32 @@ class ImageInfo(CamelCaseModel):
             svg=False,
         )
 
+    @staticmethod
+    def from_mask(mask: int) -> Self:
+        """Create image information from the bitmask of image types.
+
+        Args:
+            mask: The bitmask whose bit at the order of each image type is its flag.
+
+        Returns:
+            The image information.
+        """
+        return ImageInfo(
+            **{
+                image_type.value: bool(mask >> image_type.order & 1)
+                for image_type in ImageType.ascending_list()
+            }
+        )
+
+    @property
+    def mask(self) -> int:
+        """The bitmask whose bit at the order of each image type is its flag."""
+        mask = 0
+        for image_type in ImageType.ascending_list():
+            if getattr(self, image_type.value):
+                mask |= 1 << image_type.order
+        return mask
+
     def get(self, image_type: ImageType) -> bool:
         """Get the flag of image type.
 
@@ -45,18 +75,7 @@ class ImageInfo(CamelCaseModel):
         Returns:
             The flag of image type.
         """
-        if image_type.is_png128:
-            return self.png128
-        elif image_type.is_png256:
-            return self.png256
-        elif image_type.is_png32:
-            return self.png32
-        elif image_type.is_png64:
-            return self.png64
-        elif image_type.is_svg:
-            return self.svg
-        else:
-            raise ValueError(f"Unknown image type: {image_type}")
+        return getattr(self, image_type.value)
 
     def set(self, image_type: ImageType):
         """Set the flag of image type.
@@ -64,18 +83,7 @@ class ImageInfo(CamelCaseModel):
         Args:
             image_type: The image type to set.
         """
-        if image_type.is_png128:
-            self.png128 = True
-        elif image_type.is_png256:
-            self.png256 = True
-        elif image_type.is_png32:
-            self.png32 = True
-        elif image_type.is_png64:
-            self.png64 = True
-        elif image_type.is_svg:
-            self.svg = True
-        else:
-            raise ValueError(f"Unknown image type: {image_type}")
+        setattr(self, image_type.value, True)
 
     def unset(self, image_type: ImageType):
         """Unset the flag of image type.
@@ -83,16 +91,36 @@ class ImageInfo(CamelCaseModel):
         Args:
             image_type: The image type to unset.
         """
-        if image_type.is_png128:
-            self.png128 = False
-        elif image_type.is_png256:
-            self.png256 = False
-        elif image_type.is_png32:
-            self.png32 = False
-        elif image_type.is_png64:
-            self.png64 = False
-        elif image_type.is_svg:
-            self.svg = False
+        setattr(self, image_type.value, False)
+
+    def get_present_types(self) -> list[ImageType]:
+        """Get the image types whose images exist.
+
+        Returns:
+            The list of existing image types in ascending order.
+        """
+        return [
+            image_type
+            for image_type in ImageType.ascending_list()
+            if getattr(self, image_type.value)
+        ]
+
+    def get_largest_type(self) -> ImageType | None:
+        """Get the largest image type whose image exists.
+
+        Returns:
+            The largest existing image type if any exists, otherwise None.
+        """
+        for image_type in ImageType.descending_list():
+            if getattr(self, image_type.value):
+                return image_type
+        return None
+
+    def __or__(self, other: Self) -> Self:
+        return ImageInfo.from_mask(self.mask | other.mask)
+
+    def __and__(self, other: Self) -> Self:
+        return ImageInfo.from_mask(self.mask & other.mask)
 
     def __iter__(self) -> Iterator[tuple[ImageType, bool]]:
         """Iterate the image type and flag.
@@ -103,9 +131,7 @@ class ImageInfo(CamelCaseModel):
         Notes:
             The image types are iterated in ascending order.
         """
-        return iter(
-            [
-                (image_type, self.get(image_type))
-                for image_type in ImageType.ascending_list()
-            ]
+        return (
+            (image_type, getattr(self, image_type.value))
+            for image_type in ImageType.ascending_list()
         )
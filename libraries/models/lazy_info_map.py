@@ -0,0 +1,126 @@
+import os
+from json import loads
+from pathlib import Path
+from typing import Callable, Iterator, Type
+
+from libraries.models.abstractions.info_model import InfoModel
+from libraries.models.terminals.id import Id
+
+
+class LazyInfoMap[T: InfoModel]:
+    """A lazy view of the information indexed by the ID of each directory.
+
+    The raw JSON of each information is read only when it is accessed, and it is
+    validated into the model only when the model is accessed. Both are cached.
+
+    Attributes:
+        model_type: The type of the model.
+        paths: The map of directory ID and the path of its information file.
+
+    Args:
+        model_type: The type of the model.
+
+    Notes:
+        The ID of each directory is regarded as the ID of its information, and the
+        directories without the information file are skipped.
+    """
+
+    model_type: Type[T]
+    paths: dict[str, Path]
+
+    def __init__(self, model_type: Type[T]) -> None:
+        self.model_type = model_type
+        model_dir = model_type.get_info_category().get_model_dir_path()
+        with os.scandir(model_dir) as entries:
+            self.paths = {
+                entry.name: info_path
+                for entry in entries
+                if entry.is_dir()
+                and (info_path := model_dir.joinpath(entry.name, "info.json")).is_file()
+            }
+        self.__raws: dict[str, dict] = dict()
+        self.__models: dict[str, T] = dict()
+
+    def __contains__(self, info_id: Id | str) -> bool:
+        return str(info_id) in self.paths
+
+    def __iter__(self) -> Iterator[Id]:
+        return iter(self.get_ids())
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def get_ids(self) -> list[Id]:
+        """Gets the IDs of all information.
+
+        Returns:
+            The sorted list of IDs.
+        """
+        return [Id(info_id) for info_id in sorted(self.paths)]
+
+    def get_raw(self, info_id: Id | str) -> dict | None:
+        """Gets the raw JSON of the information without validation.
+
+        Args:
+            info_id: The ID of the information.
+
+        Returns:
+            The raw JSON of the information if it exists, otherwise None.
+        """
+        key = str(info_id)
+        if (raw := self.__raws.get(key, None)) is None:
+            if (path := self.paths.get(key, None)) is None:
+                return None
+            with open(path, "r") as fp:
+                raw = self.__raws[key] = loads(fp.read())
+        return raw
+
+    def get(self, info_id: Id | str) -> T | None:
+        """Gets the validated information.
+
+        Args:
+            info_id: The ID of the information.
+
+        Returns:
+            The information if it exists, otherwise None.
+        """
+        key = str(info_id)
+        if (model := self.__models.get(key, None)) is None:
+            if (raw := self.get_raw(key)) is None:
+                return None
+            model = self.__models[key] = self.model_type.model_validate(raw)
+        return model
+
+    def filter(self, predicate: Callable[[dict], bool]) -> list[T]:
+        """Gets the validated information whose raw JSON satisfies the predicate.
+
+        Args:
+            predicate: The predicate on the raw JSON of the information.
+
+        Returns:
+            The list of information sorted by ID.
+
+        Notes:
+            Only the information satisfying the predicate is validated.
+        """
+        return [
+            self.get(info_id)
+            for info_id in sorted(self.paths)
+            if predicate(self.get_raw(info_id))
+        ]
+
+    def update(self, info: T) -> None:
+        """Updates the cached information after it is saved.
+
+        Args:
+            info: The information to update.
+        """
+        key = str(info.id)
+        self.paths[key] = (
+            self.model_type.get_info_category()
+            .get_model_dir_path()
+            .joinpath(key)
+            .joinpath("info.json")
+        )
+        self.__raws[key] = info.model_dump(mode="json", by_alias=True)
+        self.__models[key] = info
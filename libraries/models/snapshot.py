@@ -0,0 +1,180 @@
+import mmap
+import struct
+from json import loads
+from pathlib import Path
+from typing import Self, Type
+
+from libraries.models.abstractions.enum_type_model import EnumTypeModel
+from libraries.models.abstractions.info_model import InfoModel
+from libraries.models.asset import Asset
+from libraries.models.enum_info_list import EnumInfoList
+from libraries.models.network import Network
+from libraries.models.protocol import Protocol
+from libraries.models.terminals.id import Id
+from libraries.models.terminals.info_category import InfoCategory
+
+SNAPSHOT_MAGIC: bytes = b"AIV2SNAP"
+"""The magic bytes at the beginning of the snapshot file."""
+SNAPSHOT_FORMAT_VERSION: int = 1
+"""The version of the snapshot file format."""
+SNAPSHOT_HEADER: struct.Struct = struct.Struct("<8sII")
+"""The header of the snapshot file (magic bytes, format version, index length)."""
+SNAPSHOT_PATH: Path = Path(__file__).parent.joinpath("catalog.snapshot")
+"""The default path of the snapshot file."""
+
+
+def get_enum_key(enum_type: EnumTypeModel) -> str:
+    """Gets the key of the enum information list in the snapshot.
+
+    Args:
+        enum_type: The enum type model.
+
+    Returns:
+        The key of the enum information list.
+    """
+    return f"{enum_type.type}/{enum_type.value}"
+
+
+class Snapshot:
+    """A memory-mapped snapshot of the whole catalog of information.
+
+    The snapshot file consists of a header, a JSON index of the byte ranges of
+    each record and the records encoded in JSON. The records are validated into
+    models only when they are accessed, and the models are cached.
+
+    Attributes:
+        version: The version of asset-info-v2 which built the snapshot.
+        records: The map of information category and the map of ID and the byte
+            range of each record.
+        enums: The map of enum key and the byte range of each enum information list.
+
+    Args:
+        snapshot_path: The path of the snapshot file.
+
+    Raises:
+        ValueError: If the file is not a snapshot or its format is not supported.
+    """
+
+    version: str
+    records: dict[str, dict[str, tuple[int, int]]]
+    enums: dict[str, tuple[int, int]]
+
+    def __init__(self, snapshot_path: Path = SNAPSHOT_PATH) -> None:
+        with open(snapshot_path, "rb") as fp:
+            self.__buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, format_version, index_length = SNAPSHOT_HEADER.unpack_from(self.__buffer)
+        if magic != SNAPSHOT_MAGIC:
+            self.close()
+            raise ValueError(f"Invalid snapshot file: {snapshot_path}")
+        if format_version != SNAPSHOT_FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported snapshot format: {format_version}")
+        self.__data_offset = SNAPSHOT_HEADER.size + index_length
+        index = loads(self.__buffer[SNAPSHOT_HEADER.size : self.__data_offset])
+        self.version = index["version"]
+        self.records = index["records"]
+        self.enums = index["enums"]
+        self.__models: dict[str, dict[str, InfoModel]] = dict()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the memory-mapped snapshot file."""
+        self.__buffer.close()
+
+    def __read(self, byte_range: tuple[int, int]) -> bytes:
+        """Reads the bytes of the record.
+
+        Args:
+            byte_range: The offset from the data section and the length of the record.
+
+        Returns:
+            The bytes of the record.
+        """
+        offset, length = byte_range
+        start = self.__data_offset + offset
+        return self.__buffer[start : start + length]
+
+    def get_ids(self, category: InfoCategory) -> list[Id]:
+        """Gets the IDs of the information in the category.
+
+        Args:
+            category: The information category.
+
+        Returns:
+            The sorted list of IDs.
+        """
+        return [Id(info_id) for info_id in sorted(self.records.get(category.value, {}))]
+
+    def get_info[T: InfoModel](self, model_type: Type[T], info_id: Id) -> T | None:
+        """Gets the information of the model type from its ID.
+
+        Args:
+            model_type: The type of the model.
+            info_id: The ID of the information.
+
+        Returns:
+            The information if it exists, otherwise None.
+        """
+        category = model_type.get_info_category().value
+        models = self.__models.setdefault(category, dict())
+        if (model := models.get(str(info_id), None)) is None:
+            byte_range = self.records.get(category, {}).get(str(info_id), None)
+            if byte_range is None:
+                return None
+            model = model_type.model_validate(loads(self.__read(byte_range)))
+            models[str(info_id)] = model
+        return model
+
+    def get_asset(self, asset_id: Id) -> Asset | None:
+        """Gets the asset information from its ID.
+
+        Args:
+            asset_id: The asset ID.
+
+        Returns:
+            The asset information if it exists, otherwise None.
+        """
+        return self.get_info(Asset, asset_id)
+
+    def get_network(self, network_id: Id) -> Network | None:
+        """Gets the network information from its ID.
+
+        Args:
+            network_id: The network ID.
+
+        Returns:
+            The network information if it exists, otherwise None.
+        """
+        return self.get_info(Network, network_id)
+
+    def get_protocol(self, protocol_id: Id) -> Protocol | None:
+        """Gets the protocol information from its ID.
+
+        Args:
+            protocol_id: The protocol ID.
+
+        Returns:
+            The protocol information if it exists, otherwise None.
+        """
+        return self.get_info(Protocol, protocol_id)
+
+    def get_enum_info_list(self, enum_type: EnumTypeModel) -> EnumInfoList:
+        """Gets the enum information list from the enum type.
+
+        Args:
+            enum_type: The enum type model.
+
+        Returns:
+            The enum information list.
+
+        Raises:
+            KeyError: If the enum information list is not in the snapshot.
+        """
+        return EnumInfoList.model_validate(
+            loads(self.__read(self.enums[get_enum_key(enum_type)]))
+        )
@@ -1,5 +1,6 @@
 from abc import abstractmethod
 from enum import StrEnum
+from functools import cache
 from typing import Any, Annotated, Self
 
 from pydantic import RootModel, BeforeValidator
@@ -24,6 +25,9 @@ class EnumModel[T: StrEnum](RootModel[Annotated[T, BeforeValidator(_check_enum)]
 
     Notes:
         T should be a string Enum.
+        The list from `ascending_list` is created once per class, and its instances
+        and their ranks are kept, so that the order and the constructors of each
+        value are constant-time.
     """
 
     def __eq__(self, other: Any) -> bool:
@@ -37,13 +41,13 @@ class EnumModel[T: StrEnum](RootModel[Annotated[T, BeforeValidator(_check_enum)]
         return self.order < other.order
 
     def __le__(self, other: Self) -> bool:
-        return self.__lt__(other) or self.__eq__(other)
+        return self.order <= other.order
 
     def __gt__(self, other: Self) -> bool:
-        return not self.__le__(other)
+        return self.order > other.order
 
     def __ge__(self, other: Self) -> bool:
-        return not self.__lt__(other)
+        return self.order >= other.order
 
     def __hash__(self) -> int:
         return self.root.__hash__()
@@ -58,7 +62,7 @@ class EnumModel[T: StrEnum](RootModel[Annotated[T, BeforeValidator(_check_enum)]
         Returns:
             The order of the Enum.
         """
-        return self.ascending_list().index(self.root)
+        return self._get_rank_map()[self.root]
 
     @property
     def value(self) -> str:
@@ -79,6 +83,38 @@ class EnumModel[T: StrEnum](RootModel[Annotated[T, BeforeValidator(_check_enum)]
         """
         raise NotImplementedError
 
+    @classmethod
+    @cache
+    def _get_instance_map(cls) -> dict[T, Self]:
+        """Get the map of each value and its shared instance in ascending order.
+
+        Returns:
+            The map of each value and its shared instance.
+        """
+        return {instance.root: instance for instance in cls.ascending_list()}
+
+    @classmethod
+    @cache
+    def _get_rank_map(cls) -> dict[T, int]:
+        """Get the map of each value and its rank in ascending order.
+
+        Returns:
+            The map of each value and its rank.
+        """
+        return {value: rank for rank, value in enumerate(cls._get_instance_map())}
+
+    @classmethod
+    def _of(cls, value: T) -> Self:
+        """Get the shared instance of the value.
+
+        Args:
+            value: The value of the Enum.
+
+        Returns:
+            The shared instance of the value.
+        """
+        return cls._get_instance_map()[value]
+
     @classmethod
     def descending_list(cls) -> list[Self]:
         """Get the list of Enum in descending order.
@@ -86,4 +122,4 @@ class EnumModel[T: StrEnum](RootModel[Annotated[T, BeforeValidator(_check_enum)]
         Returns:
             The list of Enum in descending order.
         """
-        return list(reversed(cls.ascending_list()))
+        return list(reversed(cls._get_instance_map().values()))
@@ -21,37 +21,49 @@ def _check_str(s: Any) -> str:
 class StrModel(
     RootModel[Annotated[str, BeforeValidator(_check_str)]], metaclass=ABCMeta
 ):
-    """A constrained `str`."""
+    """A constrained `str`.
+
+    Notes:
+        Each comparison is a single comparison of the root strings, whose hashes are
+        cached by the interpreter. Subclasses comparing by another key should
+        override all comparison methods and `__hash__` together.
+    """
+
+    def _other_root(self, other: Self | str) -> str:
+        """Gets the string to compare with from the other object.
+
+        Args:
+            other: The object to compare with.
+
+        Returns:
+            The string of the other object.
+
+        Raises:
+            ValueError: If the other object is neither `StrModel` nor `str`.
+        """
+        if isinstance(other, StrModel):
+            return other.root
+        elif isinstance(other, str):
+            return other
+        raise ValueError(f"Cannot compare {self} with {other}")
 
     def __eq__(self, other: Self | str) -> bool:
-        match other:
-            case StrModel():
-                return self.root == other.root
-            case str():
-                return self.root == other
-            case _:
-                raise ValueError(f"Cannot compare {self} with {other}")
+        return self.root == self._other_root(other)
 
     def __ne__(self, other: Self | str) -> bool:
-        return not self.__eq__(other)
+        return self.root != self._other_root(other)
 
     def __lt__(self, other: Self | str) -> bool:
-        match other:
-            case StrModel():
-                return self.root < other.root
-            case str():
-                return self.root < other
-            case _:
-                raise ValueError(f"Cannot compare {self} with {other}")
+        return self.root < self._other_root(other)
 
     def __le__(self, other: Self | str) -> bool:
-        return self.__lt__(other) or self.__eq__(other)
+        return self.root <= self._other_root(other)
 
     def __gt__(self, other: Self | str) -> bool:
-        return not self.__le__(other)
+        return self.root > self._other_root(other)
 
     def __ge__(self, other: Self | str) -> bool:
-        return not self.__lt__(other)
+        return self.root >= self._other_root(other)
 
     def __hash__(self) -> int:
         return hash(self.root)
@@ -11,37 +11,41 @@ ADDRESS_TYPES = Union[AddressEvm, AddressBitcoin]
 class Address(RootModel[ADDRESS_TYPES]):
     """A union of constrained `str` about each address of blockchain networks."""
 
-    def __eq__(self, other: Self) -> bool:
-        if self.is_evm_address and other.is_evm_address:
-            return self.root.__eq__(other.root)
-        elif self.is_bitcoin_address and other.is_bitcoin_address:
-            return self.root.__eq__(other.root)
-        else:
+    def _other_root(self, other: Self) -> ADDRESS_TYPES:
+        """Gets the address to compare with from the other address.
+
+        Args:
+            other: The address to compare with.
+
+        Returns:
+            The root address of the other address.
+
+        Raises:
+            ValueError: If the types of the addresses are different.
+        """
+        if type(self.root) is not type(other.root):
             raise ValueError(
                 f"Cannot compare difference addresses {type(self.root)} and {type(other.root)}."
             )
+        return other.root
+
+    def __eq__(self, other: Self) -> bool:
+        return self.root == self._other_root(other)
 
     def __ne__(self, other: Self) -> bool:
-        return not self.__eq__(other)
+        return self.root != self._other_root(other)
 
     def __lt__(self, other: Self) -> bool:
-        if self.is_evm_address and other.is_evm_address:
-            return self.root.__lt__(other.root)
-        elif self.is_bitcoin_address and other.is_bitcoin_address:
-            return self.root.__lt__(other.root)
-        else:
-            raise ValueError(
-                f"Cannot compare difference addresses {type(self.root)} and {type(other.root)}."
-            )
+        return self.root < self._other_root(other)
 
     def __le__(self, other: Self) -> bool:
-        return self.__lt__(other) or self.__eq__(other)
+        return self.root <= self._other_root(other)
 
     def __gt__(self, other: Self) -> bool:
-        return not self.__le__(other)
+        return self.root > self._other_root(other)
 
     def __ge__(self, other: Self) -> bool:
-        return not self.__lt__(other)
+        return self.root >= self._other_root(other)
 
     def __hash__(self) -> int:
         return self.root.__hash__()
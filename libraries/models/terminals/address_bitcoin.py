@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Self
 
 from bitcoinlib.encoding import EncodingError
@@ -5,29 +6,70 @@ from bitcoinlib.keys import deserialize_address
 
 from libraries.models.templates.str_model import StrModel
 
+DESERIALIZED_ADDRESS_CACHE_SIZE: int = 4096
+"""The maximum number of deserialized Bitcoin addresses to keep in the process."""
+
+
+@lru_cache(maxsize=DESERIALIZED_ADDRESS_CACHE_SIZE)
+def _deserialize_address(address: str) -> tuple[str, str, str]:
+    """Deserializes the Bitcoin address.
+
+    Args:
+        address: The Bitcoin address.
+
+    Returns:
+        The public key hash, encoding type and script type of the address.
+
+    Raises:
+        ValueError: If the address is not a valid Bitcoin address.
+    """
+    try:
+        result = deserialize_address(address)
+    except EncodingError:
+        raise ValueError(f"Invalid Bitcoin address: {address}")
+    return (
+        result.get("public_key_hash"),
+        result.get("encoding"),
+        result.get("script_type"),
+    )
+
 
 class AddressBitcoin(StrModel):
-    """A constrained `str` for the Bitcoin address."""
+    """A constrained `str` for the Bitcoin address.
+
+    Notes:
+        The address is deserialized once per instance at validation, and the result
+        is kept in a slot. Deserialization of the same string is shared in the
+        process by a bounded LRU cache. Addresses are ordered by their public key
+        hash, and then by their lowercase string as they are compared for equality.
+    """
+
+    __slots__ = ("_deserialized",)
 
     @property
-    def __deserialized_result(self) -> dict:
+    def __deserialized_result(self) -> tuple[str, str, str]:
         """The result from the deserialization the Bitcoin address."""
-        return deserialize_address(self.root)
+        try:
+            return self._deserialized
+        except AttributeError:
+            # Copied or unpickled instances do not carry the slot.
+            object.__setattr__(self, "_deserialized", _deserialize_address(self.root))
+            return self._deserialized
 
     @property
     def public_key_hash(self) -> str:
         """The public key hash of the Bitcoin address."""
-        return self.__deserialized_result.get("public_key_hash")
+        return self.__deserialized_result[0]
 
     @property
     def encoding_type(self) -> str:
         """The encoding type of the Bitcoin address."""
-        return self.__deserialized_result.get("encoding")
+        return self.__deserialized_result[1]
 
     @property
     def script_type(self) -> str:
         """The script type of the Bitcoin address."""
-        return self.__deserialized_result.get("script_type")
+        return self.__deserialized_result[2]
 
     def __eq__(self, other: Self | str) -> bool:
         match other:
@@ -38,14 +80,29 @@ class AddressBitcoin(StrModel):
             case _:
                 raise ValueError(f"Cannot compare {self} with {other}")
 
+    def __ne__(self, other: Self | str) -> bool:
+        return not self.__eq__(other)
+
+    @property
+    def __sort_key(self) -> tuple[str, str]:
+        """The key to order the Bitcoin address, consistent with the equality."""
+        return self.public_key_hash, self.root.lower()
+
     def __lt__(self, other: Self) -> bool:
-        return self.public_key_hash < other.public_key_hash
+        return self.__sort_key < other.__sort_key
+
+    def __le__(self, other: Self) -> bool:
+        return self.__sort_key <= other.__sort_key
+
+    def __gt__(self, other: Self) -> bool:
+        return self.__sort_key > other.__sort_key
+
+    def __ge__(self, other: Self) -> bool:
+        return self.__sort_key >= other.__sort_key
 
     def __hash__(self) -> int:
         return hash(self.public_key_hash)
 
     def validate_str(self) -> Self:
-        try:
-            return deserialize_address(self.root).get("address")
-        except EncodingError:
-            raise ValueError(f"Invalid Bitcoin address: {self.root}")
+        object.__setattr__(self, "_deserialized", _deserialize_address(self.root))
+        return self
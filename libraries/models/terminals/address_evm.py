@@ -6,32 +6,68 @@ from libraries.models.templates.str_model import StrModel
 
 
 class AddressEvm(StrModel):
-    """A constrained `str` for the EVM address."""
+    """A constrained `str` for the EVM address.
+
+    Notes:
+        The 160-bit integer of the address is computed once at validation and kept
+        in a slot, so that comparisons and hashing are integer operations.
+    """
+
+    __slots__ = ("_int_value",)
+
+    @property
+    def int_value(self) -> int:
+        """The 160-bit integer of the EVM address."""
+        try:
+            return self._int_value
+        except AttributeError:
+            # Copied or unpickled instances do not carry the slot.
+            object.__setattr__(self, "_int_value", int(self.root, 16))
+            return self._int_value
+
+    def _other_int(self, other: Self | str) -> int:
+        """Gets the integer of the address to compare with from the other object.
+
+        Args:
+            other: The object to compare with.
+
+        Returns:
+            The integer of the other address.
+
+        Raises:
+            ValueError: If the other object is neither `AddressEvm` nor `str`.
+        """
+        if isinstance(other, AddressEvm):
+            return other.int_value
+        elif isinstance(other, str):
+            return int(other, 16)
+        raise ValueError(f"Cannot compare {self} with {other}")
 
     def __eq__(self, other: Self | str) -> bool:
-        match other:
-            case AddressEvm():
-                return int(self.root, 16) == int(other.root, 16)
-            case str():
-                return int(self.root, 16) == int(other, 16)
-            case _:
-                raise ValueError(f"Cannot compare {self} with {other}")
-
-    def __lt__(self, other: Self) -> bool:
-        match other:
-            case AddressEvm():
-                return int(self.root, 16) < int(other.root, 16)
-            case str():
-                return int(self.root, 16) < int(other, 16)
-            case _:
-                raise ValueError(f"Cannot compare {self} with {other}")
+        return self.int_value == self._other_int(other)
+
+    def __ne__(self, other: Self | str) -> bool:
+        return self.int_value != self._other_int(other)
+
+    def __lt__(self, other: Self | str) -> bool:
+        return self.int_value < self._other_int(other)
+
+    def __le__(self, other: Self | str) -> bool:
+        return self.int_value <= self._other_int(other)
+
+    def __gt__(self, other: Self | str) -> bool:
+        return self.int_value > self._other_int(other)
+
+    def __ge__(self, other: Self | str) -> bool:
+        return self.int_value >= self._other_int(other)
 
     def __hash__(self) -> int:
-        return int(self.root, 16)
+        return self.int_value
 
     def validate_str(self) -> Self:
         if not Web3.is_address(self.root):
             raise ValueError(f"Invalid EVM address: {self.root}")
         if not Web3.is_checksum_address(self.root):
             raise ValueError(f"Invalid checksum address: {self.root}")
+        object.__setattr__(self, "_int_value", int(self.root, 16))
         return self
@@ -40,7 +40,7 @@ class EnumTypeId(EnumTypeModel[_EnumTypeIdEnum]):
         Returns:
             The enum type for asset.
         """
-        return EnumTypeId(_EnumTypeIdEnum.ASSET)
+        return EnumTypeId._of(_EnumTypeIdEnum.ASSET)
 
     @staticmethod
     def asset_reference() -> Self:
@@ -49,7 +49,7 @@ class EnumTypeId(EnumTypeModel[_EnumTypeIdEnum]):
         Returns:
             The enum type for reference in asset.
         """
-        return EnumTypeId(_EnumTypeIdEnum.ASSET_REFERENCE)
+        return EnumTypeId._of(_EnumTypeIdEnum.ASSET_REFERENCE)
 
     @staticmethod
     def network() -> Self:
@@ -58,7 +58,7 @@ class EnumTypeId(EnumTypeModel[_EnumTypeIdEnum]):
         Returns:
             The enum type for network.
         """
-        return EnumTypeId(_EnumTypeIdEnum.NETWORK)
+        return EnumTypeId._of(_EnumTypeIdEnum.NETWORK)
 
     @staticmethod
     def network_explorer() -> Self:
@@ -67,7 +67,7 @@ class EnumTypeId(EnumTypeModel[_EnumTypeIdEnum]):
         Returns:
             The enum type for explorer in network.
         """
-        return EnumTypeId(_EnumTypeIdEnum.NETWORK_EXPLORER)
+        return EnumTypeId._of(_EnumTypeIdEnum.NETWORK_EXPLORER)
 
     @staticmethod
     def protocol() -> Self:
@@ -76,4 +76,4 @@ class EnumTypeId(EnumTypeModel[_EnumTypeIdEnum]):
         Returns:
             The enum type for protocol.
         """
-        return EnumTypeId(_EnumTypeIdEnum.PROTOCOL)
+        return EnumTypeId._of(_EnumTypeIdEnum.PROTOCOL)
@@ -38,7 +38,7 @@ class EnumTypeTag(EnumTypeModel[_EnumTypeTagEnum]):
         Returns:
             The enum type for asset.
         """
-        return EnumTypeTag(_EnumTypeTagEnum.ASSET)
+        return EnumTypeTag._of(_EnumTypeTagEnum.ASSET)
 
     @staticmethod
     def asset_contracts() -> Self:
@@ -47,7 +47,7 @@ class EnumTypeTag(EnumTypeModel[_EnumTypeTagEnum]):
         Returns:
             The enum type for contracts in asset.
         """
-        return EnumTypeTag(_EnumTypeTagEnum.ASSET_CONTRACTS)
+        return EnumTypeTag._of(_EnumTypeTagEnum.ASSET_CONTRACTS)
 
     @staticmethod
     def network() -> Self:
@@ -56,7 +56,7 @@ class EnumTypeTag(EnumTypeModel[_EnumTypeTagEnum]):
         Returns:
             The enum type for network.
         """
-        return EnumTypeTag(_EnumTypeTagEnum.NETWORK)
+        return EnumTypeTag._of(_EnumTypeTagEnum.NETWORK)
 
     @staticmethod
     def protocol() -> Self:
@@ -65,4 +65,4 @@ class EnumTypeTag(EnumTypeModel[_EnumTypeTagEnum]):
         Returns:
             The enum type for protocol.
         """
-        return EnumTypeTag(_EnumTypeTagEnum.PROTOCOL)
+        return EnumTypeTag._of(_EnumTypeTagEnum.PROTOCOL)
@@ -170,7 +170,7 @@ class ImageType(EnumModel[_ImageTypeEnum]):
         Returns:
             The enum type for 128x128 PNG image.
         """
-        return ImageType(_ImageTypeEnum.PNG128)
+        return ImageType._of(_ImageTypeEnum.PNG128)
 
     @staticmethod
     def png256() -> Self:
@@ -179,7 +179,7 @@ class ImageType(EnumModel[_ImageTypeEnum]):
         Returns:
             The enum type for 256x256 PNG image.
         """
-        return ImageType(_ImageTypeEnum.PNG256)
+        return ImageType._of(_ImageTypeEnum.PNG256)
 
     @staticmethod
     def png32() -> Self:
@@ -188,7 +188,7 @@ class ImageType(EnumModel[_ImageTypeEnum]):
         Returns:
             The enum type for 32x32 PNG image.
         """
-        return ImageType(_ImageTypeEnum.PNG32)
+        return ImageType._of(_ImageTypeEnum.PNG32)
 
     @staticmethod
     def png64() -> Self:
@@ -197,7 +197,7 @@ class ImageType(EnumModel[_ImageTypeEnum]):
         Returns:
             The enum type for 64x64 PNG image.
         """
-        return ImageType(_ImageTypeEnum.PNG64)
+        return ImageType._of(_ImageTypeEnum.PNG64)
 
     @staticmethod
     def svg() -> Self:
@@ -206,7 +206,7 @@ class ImageType(EnumModel[_ImageTypeEnum]):
         Returns:
             The enum type for SVG image.
         """
-        return ImageType(_ImageTypeEnum.SVG)
+        return ImageType._of(_ImageTypeEnum.SVG)
 
     @classmethod
     def ascending_list(cls) -> list[Self]:
@@ -62,7 +62,7 @@ class InfoCategory(EnumModel[_InfoCategoryEnum]):
         Returns:
             The information category for asset.
         """
-        return InfoCategory(_InfoCategoryEnum.ASSET)
+        return InfoCategory._of(_InfoCategoryEnum.ASSET)
 
     @staticmethod
     def network() -> Self:
@@ -71,7 +71,7 @@ class InfoCategory(EnumModel[_InfoCategoryEnum]):
         Returns:
             The information category for network.
         """
-        return InfoCategory(_InfoCategoryEnum.NETWORK)
+        return InfoCategory._of(_InfoCategoryEnum.NETWORK)
 
     @staticmethod
     def protocol() -> Self:
@@ -80,7 +80,7 @@ class InfoCategory(EnumModel[_InfoCategoryEnum]):
         Returns:
             The information category for protocol.
         """
-        return InfoCategory(_InfoCategoryEnum.PROTOCOL)
+        return InfoCategory._of(_InfoCategoryEnum.PROTOCOL)
 
     def get_enum_type(self) -> EnumTypeId:
         """Gets the enum type from the information category.
@@ -0,0 +1,67 @@
+import subprocess
+from pathlib import Path
+
+from libraries.models.terminals.info_category import InfoCategory
+from libraries.utils.file import PWD
+
+SOURCE_DIR_NAMES: frozenset[str] = frozenset(["libraries"])
+"""The directories of the sources which all preprocessing depends on."""
+
+
+def get_changed_path_list(ref: str) -> list[Path]:
+    """Gets the files changed since the given git reference.
+
+    Args:
+        ref: The git reference to compare with. (e.g. `origin/main`, `HEAD~1`)
+
+    Returns:
+        The sorted list of the changed paths relative to the repository, including
+        the uncommitted and untracked ones.
+
+    Raises:
+        ValueError: If git fails to compare with the reference.
+    """
+    commands = [
+        ["git", "diff", "--name-only", "--no-renames", ref, "--"],
+        ["git", "ls-files", "--others", "--exclude-standard"],
+    ]
+    changed_paths: set[Path] = set()
+    for command in commands:
+        result = subprocess.run(command, cwd=PWD, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(f"Failed to get changes since {ref}: {result.stderr}")
+        changed_paths.update(Path(line) for line in result.stdout.splitlines() if line)
+    return sorted(changed_paths)
+
+
+def is_source_changed(changed_paths: list[Path]) -> bool:
+    """Checks if the sources of the preprocessing are changed.
+
+    Args:
+        changed_paths: The changed paths relative to the repository.
+
+    Returns:
+        True if any path is in `SOURCE_DIR_NAMES`, False otherwise.
+    """
+    return any(path.parts[0] in SOURCE_DIR_NAMES for path in changed_paths)
+
+
+def get_changed_dir_list(
+    category: InfoCategory, changed_paths: list[Path]
+) -> list[Path]:
+    """Gets the directories of the information category touched by the changes.
+
+    Args:
+        category: The information category.
+        changed_paths: The changed paths relative to the repository.
+
+    Returns:
+        The sorted list of the touched directories, including the removed ones.
+    """
+    return sorted(
+        {
+            category.get_model_dir_path().joinpath(path.parts[1])
+            for path in changed_paths
+            if len(path.parts) > 2 and path.parts[0] == category.value
+        }
+    )
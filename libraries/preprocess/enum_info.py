@@ -1,41 +1,71 @@
-import json
+from pathlib import Path
 from typing import Type
 
 from libraries.models.abstractions.info_model import InfoModel
 from libraries.models.enum_info import EnumInfo
+from libraries.preprocess.enum_store import EnumStore
+from libraries.utils.file import write_json
 
 
-def __get_id_enum_from_model[T: InfoModel](model_type: Type[T]) -> list[EnumInfo]:
-    """Gets the enum information from the given model type.
+def __get_id_enum_from_model[T: InfoModel](
+    info_list: list[tuple[T, Path]],
+) -> list[EnumInfo]:
+    """Gets the enum information from the information of the model type.
 
     Args:
-        model_type: The type of the model.
+        info_list: The list of information of the model type.
 
     Returns:
         The enum information.
     """
     return sorted(
-        [
-            EnumInfo(value=model.id, description=model.name)
-            for model, _ in model_type.get_info_list()
-        ],
+        [EnumInfo(value=model.id, description=model.name) for model, _ in info_list],
         key=lambda x: x.value,
     )
 
 
-def update_id_enum[T: InfoModel](model_type: Type[T]) -> None:
+def update_id_enum[T: InfoModel](
+    model_type: Type[T], info_list: list[tuple[T, Path]] | None = None
+) -> None:
     """Updates the enum information from the given model type.
 
     Args:
         model_type: The type of the model.
+        info_list: The list of information of the model type. (If it is not given,
+            the information is read.)
     """
     enum_info_list = [
         model.model_dump(mode="json", by_alias=True)
-        for model in __get_id_enum_from_model(model_type)
+        for model in __get_id_enum_from_model(
+            model_type.get_info_list() if info_list is None else info_list
+        )
     ]
-    with open(
-        model_type.get_info_category().get_enum_type().get_enum_path(),
-        "w",
-    ) as fp:
-        json.dump(enum_info_list, fp, indent=2, sort_keys=True)
-        fp.write("\n")
+    write_json(
+        model_type.get_info_category().get_enum_type().get_enum_path(), enum_info_list
+    )
+
+
+def patch_id_enum[T: InfoModel](
+    model_type: Type[T],
+    info_list: list[tuple[T, Path]],
+    removed_ids: list[str] | None = None,
+) -> None:
+    """Patches the enum information of the given model type in place.
+
+    Args:
+        model_type: The type of the model.
+        info_list: The list of information to insert or update.
+        removed_ids: The IDs of the information to delete.
+
+    Notes:
+        Only the given entries of the existing enum file are changed, so the other
+        information is neither read nor validated.
+    """
+    store = EnumStore.load(
+        model_type.get_info_category().get_enum_type().get_enum_path()
+    )
+    for enum_id in removed_ids or []:
+        store.delete(enum_id)
+    for enum_info in __get_id_enum_from_model(info_list):
+        store.upsert(enum_info)
+    store.save()
@@ -0,0 +1,108 @@
+from bisect import bisect_left
+from json import loads
+from pathlib import Path
+from typing import Self
+
+from libraries.models.enum_info import EnumInfo
+from libraries.models.terminals.id import Id
+from libraries.utils.file import write_json
+
+
+class EnumStore:
+    """A sorted list of the enum information in an enum file, patched by entry.
+
+    Each entry is inserted, updated or deleted by a binary search on its value, so
+    that a few entries are changed without reading the information of the model.
+
+    Attributes:
+        enum_path: The path of the enum file.
+        entries: The list of enum information in JSON sorted by value.
+        is_modified: Whether the entries are modified after loading.
+
+    Args:
+        enum_path: The path of the enum file.
+        entries: The list of enum information in JSON sorted by value.
+    """
+
+    enum_path: Path
+    entries: list[dict[str, str]]
+    is_modified: bool
+
+    def __init__(
+        self, enum_path: Path, entries: list[dict[str, str]] | None = None
+    ) -> None:
+        self.enum_path = enum_path
+        self.entries = entries or list()
+        self.is_modified = False
+
+    @staticmethod
+    def load(enum_path: Path) -> Self:
+        """Loads the enum store from the given path.
+
+        Args:
+            enum_path: The path of the enum file.
+
+        Returns:
+            The loaded enum store, or an empty enum store if the enum file is missing.
+        """
+        try:
+            with open(enum_path, "r") as fp:
+                entries = loads(fp.read())
+        except FileNotFoundError:
+            return EnumStore(enum_path)
+        return EnumStore(enum_path, sorted(entries, key=lambda x: x["value"]))
+
+    def __find(self, value: str) -> int:
+        """Finds the index of the entry with the given value.
+
+        Args:
+            value: The value of the entry.
+
+        Returns:
+            The index of the entry, or the index to insert it if it does not exist.
+        """
+        return bisect_left(self.entries, value, key=lambda x: x["value"])
+
+    def __contains__(self, value: Id | str) -> bool:
+        idx = self.__find(str(value))
+        return idx < len(self.entries) and self.entries[idx]["value"] == str(value)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def upsert(self, enum_info: EnumInfo) -> None:
+        """Inserts the enum information, or updates it if its value already exists.
+
+        Args:
+            enum_info: The enum information.
+        """
+        entry = enum_info.model_dump(mode="json", by_alias=True)
+        idx = self.__find(entry["value"])
+        if idx < len(self.entries) and self.entries[idx]["value"] == entry["value"]:
+            if self.entries[idx] == entry:
+                return
+            self.entries[idx] = entry
+        else:
+            self.entries.insert(idx, entry)
+        self.is_modified = True
+
+    def delete(self, value: Id | str) -> None:
+        """Deletes the enum information with the given value if it exists.
+
+        Args:
+            value: The value of the enum information.
+        """
+        if value in self:
+            del self.entries[self.__find(str(value))]
+            self.is_modified = True
+
+    def save(self) -> bool:
+        """Saves the enum file if the entries are modified.
+
+        Returns:
+            True if the enum file is written, False otherwise.
+        """
+        if not self.is_modified:
+            return False
+        self.is_modified = False
+        return write_json(self.enum_path, self.entries)
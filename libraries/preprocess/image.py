@@ -1,13 +1,112 @@
 import os
+import sys
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    CancelledError,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from io import BytesIO
 from pathlib import Path
+from threading import Event, local
+from typing import BinaryIO, Callable, Iterator, Self
 
+import cairocffi
 from PIL import Image
-from cairosvg import svg2png, svg2svg
+from cairosvg.parser import Tree
+from cairosvg.surface import PNGSurface
 
 from libraries.models.terminals.image_type import ImageType
-from libraries.utils.file import search
+from libraries.preprocess.image_manifest import ImageManifest
+from libraries.preprocess.image_store import ImageStore
+from libraries.preprocess.svg import normalize_svg
+from libraries.utils.file import INFO_FILE_DEPTH, scan
 
 PNG_TYPES: list[ImageType] = [typ for typ in ImageType.descending_list() if typ.is_png]
+PNG_RESAMPLE: Image.Resampling = Image.Resampling.LANCZOS
+"""The resampling filter to downscale PNG images."""
+CANCEL_CHECK_INTERVAL: float = 0.1
+"""The interval in seconds to check the cancellation of creating images."""
+
+
+class PngEncodingProfile:
+    """A profile to encode PNG images.
+
+    Attributes:
+        name: The name of the profile.
+        compress_level: The zlib compression level from 0 to 9.
+        optimize: Whether to search for the smallest encoding. (It is the slowest.)
+        palette_max_size: The maximum size of images quantized to a palette of
+            256 colors. (No image is quantized if it is 0.)
+
+    Args:
+        name: The name of the profile.
+        compress_level: The zlib compression level from 0 to 9.
+        optimize: Whether to search for the smallest encoding.
+        palette_max_size: The maximum size of images quantized to a palette.
+    """
+
+    name: str
+    compress_level: int
+    optimize: bool
+    palette_max_size: int
+
+    def __init__(
+        self, name: str, compress_level: int, optimize: bool, palette_max_size: int = 0
+    ) -> None:
+        self.name = name
+        self.compress_level = compress_level
+        self.optimize = optimize
+        self.palette_max_size = palette_max_size
+
+    @staticmethod
+    def fast() -> Self:
+        """Gets the profile for interactive use, trading the file size for speed.
+
+        Returns:
+            The fast profile.
+        """
+        return PngEncodingProfile("fast", 1, False)
+
+    @staticmethod
+    def max() -> Self:
+        """Gets the profile for the smallest lossless files.
+
+        Returns:
+            The max profile.
+        """
+        return PngEncodingProfile("max", 9, True)
+
+    @staticmethod
+    def palette() -> Self:
+        """Gets the max profile which quantizes small icons (64x64 or less) to a palette.
+
+        Returns:
+            The palette profile.
+        """
+        return PngEncodingProfile("palette", 9, True, 64)
+
+    def encode(self, img: Image) -> bytes:
+        """Encodes the image to PNG.
+
+        Args:
+            img: The image to encode.
+
+        Returns:
+            The bytes of the PNG image.
+        """
+        if max(img.size) <= self.palette_max_size and img.mode != "P":
+            img = img.convert("RGBA").quantize(256, Image.Quantize.FASTOCTREE)
+        buffer = BytesIO()
+        img.save(
+            buffer,
+            "png",
+            compress_level=self.compress_level,
+            optimize=self.optimize,
+        )
+        return buffer.getvalue()
 
 
 def __png_to_square_with_minimum_size(
@@ -31,72 +130,262 @@ def __png_to_square_with_minimum_size(
     )
 
 
-def __convert_svg_to_png256(
-    svg_path: Path, png_path: Path | None = None, overwrite: bool = True
-) -> None:
-    """Converts SVG image to a 256x256 PNG image.
+def __read_bytes(image: bytes | BinaryIO) -> bytes:
+    """Reads the bytes of the image.
 
     Args:
-        svg_path: The path of the SVG image.
-        png_path: The path of the PNG image to save.
-        overwrite: Whether to overwrite the PNG image.
+        image: The bytes or the binary buffer of the image.
+
+    Returns:
+        The bytes of the image.
+    """
+    return image if isinstance(image, bytes) else image.read()
+
+
+class _ReusablePngSurface(PNGSurface):
+    """A PNG surface of CairoSVG which reuses the Cairo surface of each size.
+
+    Attributes:
+        thread_local: The storage of the map of size and the Cairo surface in each
+            thread, so that concurrent renders never share a surface.
+    """
+
+    thread_local: local = local()
+
+    def _create_surface(
+        self, width: float, height: float
+    ) -> tuple[cairocffi.ImageSurface, int, int]:
+        width = int(round(width))
+        height = int(round(height))
+        cairo_surfaces = getattr(self.thread_local, "cairo_surfaces", None)
+        if cairo_surfaces is None:
+            cairo_surfaces = self.thread_local.cairo_surfaces = dict()
+        if (cairo_surface := cairo_surfaces.get((width, height))) is None:
+            cairo_surface = cairocffi.ImageSurface(
+                cairocffi.FORMAT_ARGB32, width, height
+            )
+            cairo_surfaces[(width, height)] = cairo_surface
+        else:
+            context = cairocffi.Context(cairo_surface)
+            context.set_operator(cairocffi.OPERATOR_CLEAR)
+            context.paint()
+        return cairo_surface, width, height
+
+
+def rasterize_svg(svg: bytes, size: int = 256) -> Image:
+    """Rasterizes the SVG image to a square RGBA image.
+
+    Args:
+        svg: The bytes of the SVG image.
+        size: The width and height of the image.
+
+    Returns:
+        The RGBA image.
 
     Notes:
-        The SVG image is converted to a 256x256 PNG image with 96 DPI.
-    """
-    png256_path = png_path or svg_path.parent.joinpath("image-256.png")
-    if overwrite or not os.path.isfile(png256_path):
-        with open(svg_path, "r") as fp:
-            svg2png(
-                bytestring=fp.read(),
-                write_to=str(png256_path),
-                output_width=256,
-                output_height=256,
-                dpi=96,
-                scale=2,
+        The SVG image is rendered with 96 DPI into the Cairo surface reused in the
+        thread, and its pixels are copied without encoding them to PNG.
+    """
+    surface = _ReusablePngSurface(
+        Tree(bytestring=svg), None, 96, output_width=size, output_height=size
+    )
+    surface.cairo.flush()
+    # Cairo stores premultiplied ARGB in native-endian 32-bit words.
+    img = Image.frombytes(
+        "RGBA",
+        (surface.width, surface.height),
+        bytes(surface.cairo.get_data()),
+        "raw",
+        "BGRa" if sys.byteorder == "little" else "ARGB",
+        surface.cairo.get_stride(),
+    )
+    if sys.byteorder == "little":
+        return img
+    # Pillow has no premultiplied decoder of ARGB, so the alpha is divided after.
+    return Image.merge("RGBa", img.split()).convert("RGBA")
+
+
+def rasterize_svg_list(
+    svgs: list[bytes], size: int = 256, max_workers: int | None = None
+) -> list[Image]:
+    """Rasterizes the SVG images to square RGBA images with a process pool.
+
+    Args:
+        svgs: The bytes of the SVG images.
+        size: The width and height of the images.
+        max_workers: The maximum number of processes to rasterize the images.
+
+    Returns:
+        The RGBA images in the same order as the SVG images.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(svgs))
+    if workers <= 1:
+        return [rasterize_svg(svg, size) for svg in svgs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                rasterize_svg,
+                svgs,
+                [size] * len(svgs),
+                chunksize=max(1, len(svgs) // (workers * 4)),
             )
+        )
 
 
-def __resize_svg_to_128(
-    svg_path: Path, resized_svg_path: Path | None = None, overwrite: bool = True
-) -> None:
+def __resize_svg_to_128(svg: bytes) -> bytes:
     """Resizes the SVG image to 128x128.
 
     Args:
-        svg_path: The path of the SVG image.
-        resized_svg_path: The path of the resized SVG image.
-        overwrite: Whether to overwrite the resized SVG image.
+        svg: The bytes of the SVG image.
+
+    Returns:
+        The bytes of the resized SVG image.
+
+    Notes:
+        The SVG image is not rendered, but only its root size is rewritten and its
+        markup is minified.
     """
-    resized_svg_path = resized_svg_path or svg_path.parent.joinpath("image.svg")
-    if overwrite or not os.path.isfile(resized_svg_path):
-        with open(svg_path, "r") as fp:
-            svg2svg(
-                bytestring=fp.read(),
-                write_to=str(resized_svg_path),
-                output_width=128,
-                output_height=128,
-                dpi=72,
-            )
+    return normalize_svg(svg, 128)
 
 
-def __reform_jpg_to_png(
-    jpg_path: Path, png_path: Path | None = None, overwrite: bool = True
-) -> None:
-    """Reform JPG image to PNG image.
+def create_png_pyramid(
+    img: Image, sizes: list[int], resample: Image.Resampling = PNG_RESAMPLE
+) -> Iterator[tuple[int, Image]]:
+    """Creates the square images of each size step by step from the largest.
+
+    Args:
+        img: The square image to downscale.
+        sizes: The sizes of the images to create. (Each size should not be larger
+            than the size of the image.)
+        resample: The resampling filter to downscale each level.
+
+    Returns:
+        The iterator of each size and its image in descending order of size.
+
+    Notes:
+        Each level is downscaled from the previous level instead of the original
+        image, so that the filter only runs over a small image for small sizes.
+        If a level is smaller than the previous one by a factor of 4 or more, the
+        previous one is first reduced by averaging blocks of pixels, which is much
+        faster than the filter and does not affect the quality at that factor.
+    """
+    if img.mode not in ("L", "LA", "RGB", "RGBA"):
+        # Palette and bilevel images are resampled by the nearest neighbor.
+        img = img.convert("RGBA")
+    level = img
+    for size in sorted(sizes, reverse=True):
+        if level.size != (size, size):
+            level = level.resize((size, size), resample, reducing_gap=2.0)
+        yield size, level
+
+
+def __downscale_png_image(
+    img: Image, profile: PngEncodingProfile
+) -> dict[ImageType, bytes]:
+    """Downscales the decoded image to the PNG images of each image type.
 
     Args:
-        jpg_path: The path of the JPG image.
-        png_path: The path of the PNG image to save.
-        overwrite: Whether to overwrite the PNG image.
+        img: The decoded image.
+        profile: The profile to encode the PNG images.
+
+    Returns:
+        The map of PNG image type and its encoded image in descending order of size.
+
+    Notes:
+        The images of each size are encoded concurrently in threads, since Pillow
+        releases the GIL while encoding.
     """
-    png_path = png_path or jpg_path.parent.joinpath("image.png")
-    if overwrite or not os.path.isfile(png_path):
-        with Image.open(jpg_path) as img:
-            img.save(png_path, "png", optimize=True)
+    squared_img, img_size = __png_to_square_with_minimum_size(img)
+    target_sizes = [
+        image_type.size for image_type in PNG_TYPES if image_type.size <= img_size
+    ]
+    levels = list(create_png_pyramid(squared_img, target_sizes))
+    with ThreadPoolExecutor(max_workers=max(1, len(levels))) as executor:
+        encoded = executor.map(profile.encode, [new_img for _, new_img in levels])
+        return {
+            ImageType.get_png_image_type(size): encoded_image
+            for (size, _), encoded_image in zip(levels, encoded)
+        }
+
+
+def downscale_png_bytes(
+    image: bytes | BinaryIO, profile: PngEncodingProfile = PngEncodingProfile.max()
+) -> dict[ImageType, bytes]:
+    """Downscales the PNG image in memory.
+
+    Args:
+        image: The bytes or the binary buffer of the PNG image.
+        profile: The profile to encode the PNG images.
+
+    Returns:
+        The map of image type and its encoded image.
+    """
+    with Image.open(BytesIO(__read_bytes(image))) as img:
+        return __downscale_png_image(img, profile)
+
+
+def downscale_svg_bytes(
+    image: bytes | BinaryIO, profile: PngEncodingProfile = PngEncodingProfile.max()
+) -> dict[ImageType, bytes]:
+    """Downscales the SVG image in memory.
+
+    Args:
+        image: The bytes or the binary buffer of the SVG image.
+        profile: The profile to encode the PNG images.
+
+    Returns:
+        The map of image type and its encoded image.
+    """
+    svg = __read_bytes(image)
+    encoded_images = __downscale_png_image(rasterize_svg(svg), profile)
+    encoded_images[ImageType.svg()] = __resize_svg_to_128(svg)
+    return encoded_images
+
+
+def downscale_jpg_bytes(
+    image: bytes | BinaryIO, profile: PngEncodingProfile = PngEncodingProfile.max()
+) -> dict[ImageType, bytes]:
+    """Downscales the JPG image in memory.
+
+    Args:
+        image: The bytes or the binary buffer of the JPG image.
+        profile: The profile to encode the PNG images.
+
+    Returns:
+        The map of image type and its encoded image.
+    """
+    with Image.open(BytesIO(__read_bytes(image))) as img:
+        return __downscale_png_image(img, profile)
+
+
+def write_images(
+    dir_path: Path, encoded_images: dict[ImageType, bytes], overwrite: bool = True
+) -> list[ImageType]:
+    """Writes the encoded images in the given directory.
+
+    Args:
+        dir_path: The directory path to write the images.
+        encoded_images: The map of image type and its encoded image.
+        overwrite: Whether to overwrite the existing images.
+
+    Returns:
+        The list of image types written.
+    """
+    written_types = []
+    for image_type, encoded_image in encoded_images.items():
+        image_path = image_type.get_path(dir_path)
+        if overwrite or not os.path.isfile(image_path):
+            with open(image_path, "wb") as fp:
+                fp.write(encoded_image)
+            written_types.append(image_type)
+    return written_types
 
 
 def downscale_png(
-    dir_path: Path, png_path: Path, overwrite: bool = True
+    dir_path: Path,
+    png_path: Path,
+    overwrite: bool = True,
+    profile: PngEncodingProfile = PngEncodingProfile.max(),
 ) -> list[ImageType]:
     """Downscales the PNG image in the given directory.
 
@@ -104,27 +393,20 @@ def downscale_png(
         dir_path: The directory path to save the downscaled PNG image.
         png_path: The PNG image path to downscale.
         overwrite: Whether to overwrite the downscaled PNG image.
+        profile: The profile to encode the PNG images.
 
     Returns:
         The size list of the downscaled PNG image.
     """
-    downloaded_type = []
-    with Image.open(png_path) as img:
-        squared_img, img_size = __png_to_square_with_minimum_size(img)
-        target_sizes = [
-            image_type.size for image_type in PNG_TYPES if image_type.size <= img_size
-        ]
-        for size in target_sizes:
-            new_png_path = ImageType.get_png_image_type(size).get_path(dir_path)
-            if overwrite or not os.path.isfile(new_png_path):
-                new_img = squared_img.resize((size, size))
-                new_img.save(new_png_path, "png", optimize=True)
-                downloaded_type.append(ImageType.get_png_image_type(size))
-    return downloaded_type
+    with open(png_path, "rb") as fp:
+        return write_images(dir_path, downscale_png_bytes(fp, profile), overwrite)
 
 
 def downscale_svg(
-    dir_path: Path, svg_path: Path, overwrite: bool = True
+    dir_path: Path,
+    svg_path: Path,
+    overwrite: bool = True,
+    profile: PngEncodingProfile = PngEncodingProfile.max(),
 ) -> list[ImageType]:
     """Downscales the SVG image in the given directory.
 
@@ -132,18 +414,20 @@ def downscale_svg(
         dir_path: The directory path to save the downscaled SVG and PNG image.
         svg_path: The SVG image path to downscale.
         overwrite: Whether to overwrite the downscaled SVG image.
+        profile: The profile to encode the PNG images.
 
     Returns:
         The size list of the downscaled SVG image.
     """
-    __resize_svg_to_128(svg_path, dir_path.joinpath("image.svg"), overwrite)
-    png_path = dir_path.joinpath("image-256.png")
-    __convert_svg_to_png256(svg_path, png_path, overwrite)
-    return downscale_png(dir_path, png_path, overwrite) + [ImageType.svg()]
+    with open(svg_path, "rb") as fp:
+        return write_images(dir_path, downscale_svg_bytes(fp, profile), overwrite)
 
 
 def downscale_jpg(
-    dir_path: Path, jpg_path: Path, overwrite: bool = True
+    dir_path: Path,
+    jpg_path: Path,
+    overwrite: bool = True,
+    profile: PngEncodingProfile = PngEncodingProfile.max(),
 ) -> list[ImageType]:
     """Downscales the JPG image in the given directory.
 
@@ -151,20 +435,27 @@ def downscale_jpg(
         dir_path: The directory path to save the downscaled JPG image.
         jpg_path: The JPG image path to downscale.
         overwrite: Whether to overwrite the downscaled JPG image.
+        profile: The profile to encode the PNG images.
 
     Returns:
         The size list of the downscaled JPG image.
     """
-    png_path = dir_path.joinpath("image.png")
-    __reform_jpg_to_png(jpg_path, png_path, overwrite)
-    return downscale_png(dir_path, png_path, overwrite)
+    with open(jpg_path, "rb") as fp:
+        return write_images(dir_path, downscale_jpg_bytes(fp, profile), overwrite)
 
 
-def create_downscaled_image(base_image_path: Path) -> None:
+def create_downscaled_image(
+    base_image_path: Path,
+    profile: PngEncodingProfile = PngEncodingProfile.max(),
+    store: ImageStore | None = None,
+) -> None:
     """Creates downscaled images.
 
     Args:
         base_image_path: The path of the base image.
+        profile: The profile to encode the PNG images.
+        store: The content-addressed store of preprocessed images. (If it is given,
+            the images preprocessed from the same base image are reused.)
 
     Raises:
         ValueError: If the type of image path is unknown.
@@ -174,11 +465,133 @@ def create_downscaled_image(base_image_path: Path) -> None:
     """
     image_type = ImageType.get_image_type_from_path(base_image_path)
     if image_type.is_svg:
-        downscale_svg(base_image_path.parent, base_image_path, overwrite=True)
+        downscale_bytes = downscale_svg_bytes
     elif image_type.is_png:
-        downscale_png(base_image_path.parent, base_image_path, overwrite=True)
+        downscale_bytes = downscale_png_bytes
     else:
         raise ValueError(f"Unknown image path: {base_image_path}")
+    with open(base_image_path, "rb") as fp:
+        image = fp.read()
+    key = None if store is None else store.get_key(image)
+    if key is None or (encoded_images := store.get(key)) is None:
+        encoded_images = downscale_bytes(image, profile)
+        if key is not None:
+            store.put(key, encoded_images)
+    write_images(base_image_path.parent, encoded_images)
+
+
+def __try_create_downscaled_image(
+    base_image_path: Path, profile: PngEncodingProfile, store: ImageStore | None
+) -> str | None:
+    """Creates downscaled images, isolating the error of the directory.
+
+    Args:
+        base_image_path: The path of the base image.
+        profile: The profile to encode the PNG images.
+        store: The content-addressed store of preprocessed images.
+
+    Returns:
+        The error message if it failed, otherwise None.
+    """
+    try:
+        create_downscaled_image(base_image_path, profile, store)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return None
+
+
+def create_downscaled_image_list(
+    base_image_paths: list[Path],
+    max_workers: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
+    manifest: ImageManifest | None = None,
+    profile: PngEncodingProfile = PngEncodingProfile.max(),
+    store: ImageStore | None = None,
+    executor: Executor | None = None,
+    cancel: Event | None = None,
+) -> list[tuple[Path, str]]:
+    """Creates downscaled images of each base image with a process pool.
+
+    Args:
+        base_image_paths: The paths of the base images.
+        max_workers: The maximum number of processes to create images.
+        progress: The callback called with the number of finished directories and
+            the number of all directories whenever a directory is finished.
+        manifest: The manifest of the preprocessed images. (If it is given, the
+            directories which are current in the manifest are skipped, and the
+            directories preprocessed successfully are recorded in it.)
+        profile: The profile to encode the PNG images.
+        store: The content-addressed store of preprocessed images.
+        executor: The process pool shared with other preprocessing. (If it is
+            given, `max_workers` is ignored.)
+        cancel: The event to stop creating images. (If it is set, the images not
+            started yet are cancelled.)
+
+    Returns:
+        The list of base image paths which failed and their error messages, in the
+        same order as the base image paths.
+
+    Raises:
+        CancelledError: If the cancel event is set before all images are created.
+
+    Notes:
+        The error in a directory does not stop the other directories. Each
+        directory is processed by exactly one process, so that the output does not
+        depend on the number of processes.
+    """
+    if manifest is not None:
+        base_image_paths = [
+            base_image_path
+            for base_image_path in base_image_paths
+            if not manifest.is_current(base_image_path.parent)
+        ]
+    errors: list[str | None] = [None] * len(base_image_paths)
+
+    def run_in(pool: Executor) -> None:
+        futures = {
+            pool.submit(
+                __try_create_downscaled_image, base_image_path, profile, store
+            ): idx
+            for idx, base_image_path in enumerate(base_image_paths)
+        }
+        pending = set(futures)
+        # Only the own futures are waited and cancelled, since the pool is shared.
+        try:
+            while len(pending) > 0:
+                if cancel is not None and cancel.is_set():
+                    raise CancelledError("Cancelled before all images are created")
+                done, pending = wait(pending, CANCEL_CHECK_INTERVAL, FIRST_COMPLETED)
+                for future in done:
+                    errors[futures[future]] = future.result()
+                if len(done) > 0 and progress is not None:
+                    progress(len(futures) - len(pending), len(base_image_paths))
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+    workers = min(max_workers or os.cpu_count() or 1, len(base_image_paths))
+    if executor is not None:
+        run_in(executor)
+    elif workers <= 1:
+        for idx, base_image_path in enumerate(base_image_paths):
+            if cancel is not None and cancel.is_set():
+                raise CancelledError("Cancelled before all images are created")
+            errors[idx] = __try_create_downscaled_image(base_image_path, profile, store)
+            if progress is not None:
+                progress(idx + 1, len(base_image_paths))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as new_executor:
+            run_in(new_executor)
+    if manifest is not None:
+        for base_image_path, error in zip(base_image_paths, errors):
+            if error is None:
+                manifest.update(base_image_path.parent)
+    return [
+        (base_image_path, error)
+        for base_image_path, error in zip(base_image_paths, errors)
+        if error is not None
+    ]
 
 
 def get_base_image_list(base_dir: Path) -> list[Path]:
@@ -193,11 +606,40 @@ def get_base_image_list(base_dir: Path) -> list[Path]:
     Notes:
         The base image is the smallest image in each information directory.
     """
+    image_types = ImageType.descending_list()
+    scanned_images = scan(
+        base_dir,
+        [image_type.regex_pattern for image_type in image_types],
+        INFO_FILE_DEPTH,
+    )
     dirs_already_found = set()
     file_list = []
-    for image_type in ImageType.descending_list():
-        images = search(base_dir, image_type.regex_pattern)
+    for image_type in image_types:
+        images = scanned_images[image_type.regex_pattern]
         new_images = [file for file in images if file.parent not in dirs_already_found]
         file_list.extend(new_images)
         dirs_already_found.update([file.parent for file in new_images])
     return file_list
+
+
+def get_base_image_list_of_dirs(dir_paths: list[Path]) -> list[Path]:
+    """Gets the list of base images in the given information directories.
+
+    Args:
+        dir_paths: The paths of the information directories.
+
+    Returns:
+        The list of base images in the same order as the directories.
+
+    Notes:
+        Only the image files of each directory are checked, without scanning the
+        directories.
+    """
+    image_types = ImageType.descending_list()
+    file_list = []
+    for dir_path in dir_paths:
+        for image_type in image_types:
+            if os.path.isfile(image_path := image_type.get_path(dir_path)):
+                file_list.append(image_path)
+                break
+    return file_list
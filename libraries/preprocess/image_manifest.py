@@ -0,0 +1,196 @@
+import os
+from functools import cache
+from hashlib import sha256
+from json import dumps, loads
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Self
+
+from PIL import __version__ as PILLOW_VERSION
+from cairosvg import __version__ as CAIROSVG_VERSION
+
+from libraries.models.terminals.image_type import ImageType
+from libraries.utils.cache import CACHE_FORMAT_VERSION, hash_files
+
+
+@cache
+def get_image_preprocess_fingerprint() -> str:
+    """Gets the fingerprint of the parameters used for preprocessing images.
+
+    Returns:
+        The fingerprint of the image preprocessing.
+
+    Notes:
+        All images are preprocessed again if the source of the image preprocessing
+        or the version of Pillow or CairoSVG is changed.
+    """
+    sources = [Path(__file__).parent.joinpath(name) for name in ["image.py", "svg.py"]]
+    return f"{PILLOW_VERSION}:{CAIROSVG_VERSION}:{hash_files(sources)}"
+
+
+class ImageManifest:
+    """A manifest of the images in each directory after they are preprocessed.
+
+    Each entry records the modification time, size and content hash of every
+    image file in the directory. A directory is current if its images are the same
+    as when they were recorded, so that it does not need to be preprocessed again.
+
+    Attributes:
+        manifest_path: The path of the manifest file.
+        fingerprint: The fingerprint of the image preprocessing.
+        entries: The map of resolved directory path and the map of image file name
+            and (mtime, size, hash) of the file, or None if the file does not exist.
+        is_modified: Whether the entries are modified after loading.
+
+    Args:
+        manifest_path: The path of the manifest file.
+        fingerprint: The fingerprint of the image preprocessing.
+        entries: The map of resolved directory path and the map of image file name
+            and (mtime, size, hash) of the file, or None if the file does not exist.
+    """
+
+    manifest_path: Path
+    fingerprint: str
+    entries: dict[str, dict[str, tuple[int, int, str] | None]]
+    is_modified: bool
+
+    def __init__(
+        self,
+        manifest_path: Path,
+        fingerprint: str,
+        entries: dict[str, dict[str, tuple[int, int, str] | None]] | None = None,
+    ) -> None:
+        self.manifest_path = manifest_path
+        self.fingerprint = fingerprint
+        self.entries = entries or dict()
+        self.is_modified = False
+
+    @staticmethod
+    def load(manifest_path: Path, fingerprint: str) -> Self:
+        """Loads the manifest from the given path.
+
+        Args:
+            manifest_path: The path of the manifest file.
+            fingerprint: The fingerprint of the image preprocessing.
+
+        Returns:
+            The loaded manifest, or an empty manifest if the manifest file is
+            missing, broken or made from a different fingerprint.
+        """
+        try:
+            with open(manifest_path, "r") as fp:
+                manifest = loads(fp.read())
+            if (
+                manifest["version"] == CACHE_FORMAT_VERSION
+                and manifest["fingerprint"] == fingerprint
+            ):
+                entries = {
+                    dir_path: {
+                        name: None if state is None else tuple(state)
+                        for name, state in states.items()
+                    }
+                    for dir_path, states in manifest["entries"].items()
+                }
+                return ImageManifest(manifest_path, fingerprint, entries)
+        except Exception:
+            pass
+        return ImageManifest(manifest_path, fingerprint)
+
+    @staticmethod
+    def __get_state(file_path: Path) -> tuple[int, int, str] | None:
+        """Gets the state of the image file.
+
+        Args:
+            file_path: The path of the image file.
+
+        Returns:
+            The (mtime, size, hash) of the file, or None if the file does not exist.
+        """
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        with open(file_path, "rb") as fp:
+            return stat.st_mtime_ns, stat.st_size, sha256(fp.read()).hexdigest()
+
+    def is_current(self, dir_path: Path) -> bool:
+        """Checks if the images in the directory are the same as when recorded.
+
+        Args:
+            dir_path: The path of the directory.
+
+        Returns:
+            True if the images in the directory are current, False otherwise.
+
+        Notes:
+            The content hash of an image file is compared only if its modification
+            time or size differs from the recorded one.
+        """
+        if (states := self.entries.get(os.path.realpath(dir_path), None)) is None:
+            return False
+        for image_type in ImageType.ascending_list():
+            name = image_type.file_name
+            state = states.get(name, None)
+            try:
+                stat = os.stat(dir_path.joinpath(name))
+            except FileNotFoundError:
+                if state is None:
+                    continue
+                return False
+            if state is None:
+                return False
+            if state[:2] == (stat.st_mtime_ns, stat.st_size):
+                continue
+            new_state = self.__get_state(dir_path.joinpath(name))
+            if new_state is None or new_state[2] != state[2]:
+                return False
+            states[name] = new_state
+            self.is_modified = True
+        return True
+
+    def update(self, dir_path: Path) -> None:
+        """Records the current images in the directory.
+
+        Args:
+            dir_path: The path of the directory.
+        """
+        self.entries[os.path.realpath(dir_path)] = {
+            image_type.file_name: self.__get_state(image_type.get_path(dir_path))
+            for image_type in ImageType.ascending_list()
+        }
+        self.is_modified = True
+
+    def save(self) -> None:
+        """Saves the manifest atomically if it is modified.
+
+        Notes:
+            Entries of the removed directories are dropped, and failures on writing
+            the manifest are ignored since the manifest is only an optimization.
+        """
+        for key in [key for key in self.entries if not os.path.isdir(key)]:
+            del self.entries[key]
+            self.is_modified = True
+        if not self.is_modified:
+            return
+        tmp_path = None
+        try:
+            os.makedirs(self.manifest_path.parent, exist_ok=True)
+            with NamedTemporaryFile(
+                mode="w", dir=self.manifest_path.parent, delete=False
+            ) as fp:
+                tmp_path = fp.name
+                fp.write(
+                    dumps(
+                        {
+                            "version": CACHE_FORMAT_VERSION,
+                            "fingerprint": self.fingerprint,
+                            "entries": self.entries,
+                        },
+                        sort_keys=True,
+                    )
+                )
+            os.replace(tmp_path, self.manifest_path)
+            self.is_modified = False
+        except OSError:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -0,0 +1,162 @@
+import os
+import pickle
+from collections import defaultdict
+from hashlib import sha256
+from pathlib import Path
+from shutil import rmtree
+from tempfile import NamedTemporaryFile
+
+from libraries.models.terminals.image_type import ImageType
+
+
+def hash_image(image: bytes) -> str:
+    """Hashes the content of the image.
+
+    Args:
+        image: The bytes of the image.
+
+    Returns:
+        The hex digest of the image.
+    """
+    return sha256(image).hexdigest()
+
+
+def get_duplicate_image_groups(image_paths: list[Path]) -> list[list[Path]]:
+    """Groups the images with the same content.
+
+    Args:
+        image_paths: The paths of the images.
+
+    Returns:
+        The sorted list of the sorted groups of two or more images with the same
+        content.
+    """
+    groups: dict[str, list[Path]] = defaultdict(list)
+    for image_path in image_paths:
+        with open(image_path, "rb") as fp:
+            groups[hash_image(fp.read())].append(image_path)
+    return sorted(sorted(group) for group in groups.values() if len(group) > 1)
+
+
+class ImageStore:
+    """A content-addressed store of the images preprocessed from each source image.
+
+    Each entry is keyed on the hash of the source image and the fingerprint of the
+    image preprocessing, so that the same source image is preprocessed only once.
+    The entries of each fingerprint are kept in their own subdirectory of the store,
+    so that the entries of the other fingerprints are pruned at once.
+
+    Attributes:
+        store_dir: The directory of the store.
+        fingerprint: The fingerprint of the image preprocessing.
+        entry_dir: The subdirectory of the entries of the fingerprint.
+
+    Args:
+        store_dir: The directory of the store.
+        fingerprint: The fingerprint of the image preprocessing.
+    """
+
+    store_dir: Path
+    fingerprint: str
+    entry_dir: Path
+
+    def __init__(self, store_dir: Path, fingerprint: str) -> None:
+        self.store_dir = store_dir
+        self.fingerprint = fingerprint
+        self.entry_dir = store_dir.joinpath(hash_image(fingerprint.encode())[:16])
+
+    def prune(self) -> None:
+        """Removes the entries of the other fingerprints.
+
+        Notes:
+            Failures on removing the entries are ignored since the store is only an
+            optimization.
+        """
+        try:
+            paths = list(self.store_dir.iterdir())
+        except OSError:
+            return
+        for path in paths:
+            if path == self.entry_dir:
+                continue
+            if path.is_dir():
+                rmtree(path, ignore_errors=True)
+            else:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def get_key(self, image: bytes) -> str:
+        """Gets the key of the source image.
+
+        Args:
+            image: The bytes of the source image.
+
+        Returns:
+            The key of the source image.
+        """
+        return hash_image(self.fingerprint.encode() + b"\0" + image)
+
+    def __get_path(self, key: str) -> Path:
+        """Gets the path of the entry.
+
+        Args:
+            key: The key of the source image.
+
+        Returns:
+            The path of the entry.
+        """
+        return self.entry_dir.joinpath(key[:2]).joinpath(f"{key}.pickle")
+
+    def get(self, key: str) -> dict[ImageType, bytes] | None:
+        """Gets the preprocessed images of the source image.
+
+        Args:
+            key: The key of the source image.
+
+        Returns:
+            The map of image type and its encoded image if it is stored,
+            otherwise None.
+        """
+        try:
+            with open(self.__get_path(key), "rb") as fp:
+                encoded_images = pickle.load(fp)
+            return {
+                ImageType(image_type): encoded_image
+                for image_type, encoded_image in encoded_images.items()
+            }
+        except Exception:
+            return None
+
+    def put(self, key: str, encoded_images: dict[ImageType, bytes]) -> None:
+        """Puts the preprocessed images of the source image atomically.
+
+        Args:
+            key: The key of the source image.
+            encoded_images: The map of image type and its encoded image.
+
+        Notes:
+            Failures on writing the entry are ignored since the store is only an
+            optimization.
+        """
+        entry_path = self.__get_path(key)
+        tmp_path = None
+        try:
+            os.makedirs(entry_path.parent, exist_ok=True)
+            with NamedTemporaryFile(
+                mode="wb", dir=entry_path.parent, delete=False
+            ) as fp:
+                tmp_path = fp.name
+                pickle.dump(
+                    {
+                        image_type.value: encoded_image
+                        for image_type, encoded_image in encoded_images.items()
+                    },
+                    fp,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -1,26 +1,24 @@
-from json import load, dump
+from pathlib import Path
 from typing import Type
 
 from libraries.models.abstractions.info_model import InfoModel
-from libraries.utils.file import search
+from libraries.utils.file import write_json
 
 
-def update_info[T: InfoModel](model_type: Type[T]) -> None:
+def update_info[T: InfoModel](
+    model_type: Type[T], info_list: list[tuple[T, Path]] | None = None
+) -> None:
     """Update the information of the model type.
 
     Args:
         model_type: The type of the model.
+        info_list: The list of information of the model type. (If it is not given,
+            the information is read.)
+
+    Notes:
+        Only the information files whose canonical JSON differs are written.
     """
-    for file_path in search(
-        model_type.get_info_category().get_model_dir_path(), r"^info\.json$"
-    ):
-        with open(file_path, "r") as fp:
-            info = model_type.model_validate(load(fp))
-        with open(file_path, "w") as fp:
-            dump(
-                info.model_dump(mode="json", by_alias=True),
-                fp,
-                indent=2,
-                sort_keys=True,
-            )
-            fp.write("\n")
+    if info_list is None:
+        info_list = model_type.get_info_list()
+    for info, file_path in info_list:
+        write_json(file_path, info.model_dump(mode="json", by_alias=True))
@@ -1,48 +1,375 @@
-from typing import Type
+import os
+import sys
+from concurrent.futures import (
+    CancelledError,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from multiprocessing import get_context
+from pathlib import Path
+from threading import Event, Lock
+from typing import Callable, Type
 
-from libraries.models.abstractions.info_model import InfoModel
+from libraries.models.abstractions.info_model import InfoModel, read_info_list
 from libraries.models.asset import Asset
+from libraries.models.catalog import Catalog
 from libraries.models.network import Network
 from libraries.models.protocol import Protocol
-from libraries.preprocess.enum_info import update_id_enum
-from libraries.preprocess.image import get_base_image_list, create_downscaled_image
+from libraries.preprocess.changes import (
+    get_changed_dir_list,
+    get_changed_path_list,
+    is_source_changed,
+)
+from libraries.preprocess.enum_info import patch_id_enum, update_id_enum
+from libraries.preprocess.image import (
+    PngEncodingProfile,
+    create_downscaled_image_list,
+    get_base_image_list,
+    get_base_image_list_of_dirs,
+)
+from libraries.preprocess.image_manifest import (
+    ImageManifest,
+    get_image_preprocess_fingerprint,
+)
+from libraries.preprocess.image_store import ImageStore, get_duplicate_image_groups
 from libraries.preprocess.info import update_info
+from libraries.preprocess.snapshot import create_snapshot
+from libraries.utils.cache import get_cache_dir
+from libraries.utils.file import PWD
 
 
-def run_image_preprocess[T: InfoModel](model_type: Type[T]) -> None:
+def __report_progress(name: str) -> Callable[[int, int], None]:
+    """Creates the callback reporting the progress of the preprocessing.
+
+    Args:
+        name: The name of the preprocessing.
+
+    Returns:
+        The callback reporting the number of finished and all items.
+    """
+
+    def report(finished: int, total: int) -> None:
+        sys.stderr.write(f"\r{name}: {finished}/{total}")
+        if finished == total:
+            sys.stderr.write("\n")
+        sys.stderr.flush()
+
+    return report
+
+
+class _PreprocessProgress:
+    """A progress report of the preprocessing merged from each category.
+
+    The progress of every category is written on one line of the standard error.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = Lock()
+        self.__counts: dict[str, tuple[int, int]] = dict()
+
+    def get_callback(self, name: str) -> Callable[[int, int], None]:
+        """Creates the callback reporting the progress of the preprocessing.
+
+        Args:
+            name: The name of the preprocessing.
+
+        Returns:
+            The callback reporting the number of finished and all items.
+        """
+
+        def report(finished: int, total: int) -> None:
+            with self.__lock:
+                self.__counts[name] = (finished, total)
+                line = " | ".join(
+                    f"{name}: {finished}/{total}"
+                    for name, (finished, total) in self.__counts.items()
+                )
+                sys.stderr.write(f"\r{line}")
+                sys.stderr.flush()
+
+        return report
+
+    def close(self) -> None:
+        """Finishes the line of the progress report."""
+        with self.__lock:
+            if len(self.__counts) > 0:
+                sys.stderr.write("\n")
+                sys.stderr.flush()
+
+
+def run_image_preprocess[T: InfoModel](
+    model_type: Type[T],
+    max_workers: int | None = None,
+    use_manifest: bool = True,
+    profile: PngEncodingProfile = PngEncodingProfile.max(),
+    use_store: bool = True,
+    info_list: list[tuple[T, Path]] | None = None,
+    progress: Callable[[int, int], None] | None = None,
+    executor: Executor | None = None,
+    cancel: Event | None = None,
+) -> None:
     """Create downscaled images in all subdirectories of asset, network and protocol.
 
     Args:
         model_type: The type of the model.
+        max_workers: The maximum number of processes to create images.
+        use_manifest: Whether to skip the directories whose images are already
+            preprocessed by the same image preprocessing. (It is not used either if
+            `get_cache_dir` disables it.)
+        profile: The profile to encode the PNG images.
+        use_store: Whether to reuse the images preprocessed from the same base image.
+            (It is not used either if `get_cache_dir` disables it.)
+        info_list: The list of information of the model type. (If it is given, only
+            the directories of the information are preprocessed without scanning.)
+        progress: The callback reporting the number of finished and all directories.
+            (If it is not given, the progress is written to the standard error.)
+        executor: The process pool shared with other preprocessing.
+        cancel: The event to stop creating images.
+
+    Raises:
+        CancelledError: If the cancel event is set before all images are created.
+        ValueError: If creating images failed in any directory.
     """
-    image_path_list = get_base_image_list(
-        model_type.get_info_category().get_model_dir_path()
+    category = model_type.get_info_category()
+    fingerprint = f"{get_image_preprocess_fingerprint()}:{profile.name}"
+    cache_dir = get_cache_dir()
+    image_cache_dir = None if cache_dir is None else cache_dir.joinpath("image")
+    manifest = (
+        ImageManifest.load(image_cache_dir.joinpath(f"{category}.json"), fingerprint)
+        if use_manifest and image_cache_dir is not None
+        else None
+    )
+    store = (
+        ImageStore(image_cache_dir.joinpath("store"), fingerprint)
+        if use_store and image_cache_dir is not None
+        else None
+    )
+    if store is not None:
+        store.prune()
+    base_image_paths = (
+        get_base_image_list(category.get_model_dir_path())
+        if info_list is None
+        else get_base_image_list_of_dirs(
+            [file_path.parent for _, file_path in info_list]
+        )
     )
-    for image_path in image_path_list:
-        create_downscaled_image(image_path)
+    errors = create_downscaled_image_list(
+        base_image_paths,
+        max_workers,
+        progress or __report_progress(f"{category.value} images"),
+        manifest,
+        profile,
+        store,
+        executor,
+        cancel,
+    )
+    if manifest is not None:
+        manifest.save()
+    if len(errors) > 0:
+        raise ValueError(
+            f"Failed to create images in {len(errors)} directories:\n"
+            + "\n".join(f"{path.parent}: {error}" for path, error in errors)
+        )
+
 
+def run_image_duplicate_report() -> None:
+    """Print the groups of directories whose base images are the same."""
+    base_image_paths = [
+        base_image_path
+        for model_type in [Asset, Network, Protocol]
+        for base_image_path in get_base_image_list(
+            model_type.get_info_category().get_model_dir_path()
+        )
+    ]
+    groups = get_duplicate_image_groups(base_image_paths)
+    for group in groups:
+        print(" ".join(str(path.parent.relative_to(PWD)) for path in group))
+    print(
+        f"{len(groups)} groups of {sum(len(group) for group in groups)} directories "
+        "share their base images."
+    )
 
-def run_enum_preprocess[T: InfoModel](model_type: Type[T]) -> None:
+
+def run_enum_preprocess[T: InfoModel](
+    model_type: Type[T], info_list: list[tuple[T, Path]] | None = None
+) -> None:
     """Update enum information from the information of asset, network and protocol.
 
     Args:
         model_type: The type of the model.
+        info_list: The list of information of the model type. (If it is not given,
+            the information is read.)
     """
-    update_id_enum(model_type)
+    update_id_enum(model_type, info_list)
 
 
-def run_info_preprocess[T: InfoModel](model_type: Type[T]) -> None:
+def run_info_preprocess[T: InfoModel](
+    model_type: Type[T], info_list: list[tuple[T, Path]] | None = None
+) -> None:
     """Update the information of the model type.
 
     Args:
         model_type: The type of the model.
+        info_list: The list of information of the model type. (If it is not given,
+            the information is read.)
+    """
+    update_info(model_type, info_list)
+
+
+def run_snapshot_preprocess() -> None:
+    """Create the snapshot of all information for the package distribution."""
+    create_snapshot()
+
+
+def run_category_preprocess[T: InfoModel](
+    model_type: Type[T],
+    info_list: list[tuple[T, Path]] | None = None,
+    progress: Callable[[int, int], None] | None = None,
+    executor: Executor | None = None,
+    cancel: Event | None = None,
+    profile: PngEncodingProfile = PngEncodingProfile.max(),
+) -> None:
+    """Run a preprocessing list of the model type in a single pass.
+
+    Args:
+        model_type: The type of the model.
+        info_list: The list of information of the model type. (If it is not given,
+            the information is read.)
+        progress: The callback reporting the number of finished and all directories
+            of the image preprocessing.
+        executor: The process pool shared with other preprocessing.
+        cancel: The event to stop the preprocessing before the next stage or the
+            next image.
+        profile: The profile to encode the PNG images.
+
+    Raises:
+        CancelledError: If the preprocessing is cancelled.
+
+    Notes:
+        The information is read and validated once, and the same records are used
+        by the image, enum and information preprocessing.
+    """
+    if info_list is None:
+        info_list = model_type.get_info_list()
+    stages = [
+        lambda: run_image_preprocess(
+            model_type,
+            profile=profile,
+            info_list=info_list,
+            progress=progress,
+            executor=executor,
+            cancel=cancel,
+        ),
+        lambda: run_enum_preprocess(model_type, info_list),
+        lambda: run_info_preprocess(model_type, info_list),
+    ]
+    for stage in stages:
+        if cancel is not None and cancel.is_set():
+            raise CancelledError("Cancelled by the failure of another category")
+        stage()
+
+
+def run_preprocess(
+    max_workers: int | None = None,
+    profile: PngEncodingProfile = PngEncodingProfile.max(),
+) -> None:
+    """Run a preprocessing list of all categories concurrently.
+
+    Args:
+        max_workers: The maximum number of processes shared by all categories.
+        profile: The profile to encode the PNG images.
+
+    Raises:
+        ValueError: If the preprocessing of any category failed, with the summary of
+            the error of each category.
+
+    Notes:
+        The information of all categories is read as one catalog before the
+        categories start, and then each category runs in its own thread, sharing one
+        process pool for the images. If a category fails, the others cancel their own pending images and
+        stop before their next stage, while the shared pool is kept open until
+        every category is finished.
     """
-    update_info(model_type)
+    model_types = [Asset, Network, Protocol]
+    catalog = Catalog.load(max_workers)
+    progress = _PreprocessProgress()
+    cancel = Event()
+    # Workers are spawned, since forking a process running threads is not safe.
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1, mp_context=get_context("spawn")
+    ) as executor:
 
+        def run(model_type: Type[InfoModel]) -> None:
+            try:
+                run_category_preprocess(
+                    model_type,
+                    catalog.get_info_list(model_type),
+                    progress.get_callback(f"{model_type.get_info_category()} images"),
+                    executor,
+                    cancel,
+                    profile,
+                )
+            except BaseException:
+                cancel.set()
+                raise
 
-def run_preprocess() -> None:
-    """Run a preprocessing list."""
+        with ThreadPoolExecutor(max_workers=len(model_types)) as scheduler:
+            futures = {
+                model_type: scheduler.submit(run, model_type)
+                for model_type in model_types
+            }
+    progress.close()
+    errors = {
+        model_type.get_info_category(): error
+        for model_type, future in futures.items()
+        if (error := future.exception()) is not None
+    }
+    if len(errors) > 0:
+        raise ValueError(
+            f"Failed to preprocess {len(errors)} categories:\n"
+            + "\n".join(
+                f"{category}: {type(error).__name__}: {error}"
+                for category, error in errors.items()
+            )
+        )
+
+
+def run_changed_preprocess(
+    ref: str, profile: PngEncodingProfile = PngEncodingProfile.max()
+) -> None:
+    """Run a preprocessing list only for the directories changed since the reference.
+
+    Args:
+        ref: The git reference to compare with. (e.g. `origin/main`, `HEAD~1`)
+        profile: The profile to encode the PNG images.
+
+    Notes:
+        The images and information of the touched directories are preprocessed, and
+        their entries in the enum files are patched in place. Everything is
+        preprocessed if the sources of the preprocessing are changed.
+    """
+    changed_paths = get_changed_path_list(ref)
+    if is_source_changed(changed_paths):
+        run_preprocess(profile=profile)
+        return
     for model_type in [Asset, Network, Protocol]:
-        run_image_preprocess(model_type)
-        run_enum_preprocess(model_type)
-        run_info_preprocess(model_type)
+        category = model_type.get_info_category()
+        dir_paths = get_changed_dir_list(category, changed_paths)
+        if len(dir_paths) == 0:
+            continue
+        info_paths = [dir_path.joinpath("info.json") for dir_path in dir_paths]
+        info_list = read_info_list(
+            [(model_type, info_path) for info_path in info_paths if info_path.exists()]
+        )
+        run_image_preprocess(model_type, profile=profile, info_list=info_list)
+        patch_id_enum(
+            model_type,
+            info_list,
+            [
+                info_path.parent.name
+                for info_path in info_paths
+                if not info_path.exists()
+            ],
+        )
+        run_info_preprocess(model_type, info_list)
@@ -0,0 +1,65 @@
+from json import dumps
+from pathlib import Path
+
+from libraries.models.asset import Asset
+from libraries.models.catalog import Catalog
+from libraries.models.enum_info_list import EnumInfoList
+from libraries.models.network import Network
+from libraries.models.protocol import Protocol
+from libraries.models.snapshot import (
+    SNAPSHOT_FORMAT_VERSION,
+    SNAPSHOT_HEADER,
+    SNAPSHOT_MAGIC,
+    SNAPSHOT_PATH,
+    get_enum_key,
+)
+from libraries.models.terminals.enum_type_id import EnumTypeId
+from libraries.models.terminals.enum_type_tag import EnumTypeTag
+from libraries.utils.file import PWD, write_if_changed
+
+
+def __encode(obj: dict | list) -> bytes:
+    """Encodes the object to compact JSON bytes.
+
+    Args:
+        obj: The object to encode.
+
+    Returns:
+        The encoded bytes.
+    """
+    return dumps(obj, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def create_snapshot(snapshot_path: Path = SNAPSHOT_PATH) -> None:
+    """Creates the snapshot of all information and enum information lists.
+
+    Args:
+        snapshot_path: The path of the snapshot file to create.
+
+    Notes:
+        The snapshot file is replaced atomically with `write_if_changed`, so that
+        processes which have already mapped the old snapshot are not affected.
+    """
+    catalog = Catalog.load()
+    data = bytearray()
+    records: dict[str, dict[str, tuple[int, int]]] = dict()
+    for model_type in [Asset, Network, Protocol]:
+        category_records = records.setdefault(
+            model_type.get_info_category().value, dict()
+        )
+        for info, _ in catalog.get_info_list(model_type):
+            record = __encode(info.model_dump(mode="json", by_alias=True))
+            category_records[str(info.id)] = (len(data), len(record))
+            data.extend(record)
+    enums: dict[str, tuple[int, int]] = dict()
+    for enum_type in EnumTypeId.ascending_list() + EnumTypeTag.ascending_list():
+        record = __encode(
+            EnumInfoList.get_info_list(enum_type).model_dump(mode="json", by_alias=True)
+        )
+        enums[get_enum_key(enum_type)] = (len(data), len(record))
+        data.extend(record)
+    with open(PWD.joinpath("VERSION"), "r") as fp:
+        version = fp.read().strip()
+    index = __encode({"enums": enums, "records": records, "version": version})
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(index))
+    write_if_changed(snapshot_path, header + index + bytes(data))
@@ -0,0 +1,301 @@
+import re
+from xml.parsers.expat import ParserCreate
+from xml.sax.saxutils import escape, quoteattr
+
+SVG_EDITOR_NAMESPACES: frozenset[str] = frozenset(
+    [
+        "http://creativecommons.org/ns#",
+        "http://ns.adobe.com/AdobeIllustrator/10.0/",
+        "http://ns.adobe.com/AdobeSVGViewerExtensions/3.0/",
+        "http://ns.adobe.com/Extensibility/1.0/",
+        "http://ns.adobe.com/Flows/1.0/",
+        "http://ns.adobe.com/GenericCustomNamespace/1.0/",
+        "http://ns.adobe.com/Graphs/1.0/",
+        "http://ns.adobe.com/ImageReplacement/1.0/",
+        "http://ns.adobe.com/SaveForWeb/1.0/",
+        "http://ns.adobe.com/Variables/1.0/",
+        "http://ns.adobe.com/XPath/1.0/",
+        "http://ns.adobe.com/xap/1.0/",
+        "http://purl.org/dc/elements/1.1/",
+        "http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd",
+        "http://www.bohemiancoding.com/sketch/ns",
+        "http://www.inkscape.org/namespaces/inkscape",
+        "http://www.serif.com/",
+        "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    ]
+)
+"""The namespaces of the editors, whose elements and attributes are stripped."""
+SVG_STRIPPED_ELEMENTS: frozenset[str] = frozenset(["metadata"])
+"""The elements stripped with their children."""
+SVG_NUMERIC_ATTRIBUTES: frozenset[str] = frozenset(
+    [
+        "cx",
+        "cy",
+        "d",
+        "dx",
+        "dy",
+        "fx",
+        "fy",
+        "gradientTransform",
+        "height",
+        "offset",
+        "opacity",
+        "patternTransform",
+        "points",
+        "r",
+        "rx",
+        "ry",
+        "stroke-width",
+        "transform",
+        "viewBox",
+        "width",
+        "x",
+        "x1",
+        "x2",
+        "y",
+        "y1",
+        "y2",
+    ]
+)
+"""The attributes whose numbers are minified."""
+SVG_WHITESPACE_ELEMENTS: frozenset[str] = frozenset(
+    ["style", "text", "textPath", "tspan"]
+)
+"""The elements whose whitespace text is kept."""
+SVG_UNITS: dict[str, float] = {
+    "": 1.0,
+    "px": 1.0,
+    "pt": 4 / 3,
+    "pc": 16.0,
+    "mm": 96 / 25.4,
+    "cm": 96 / 2.54,
+    "in": 96.0,
+}
+"""The number of user units in each absolute length unit."""
+
+__NUMBER_PATTERN = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+__LENGTH_PATTERN = re.compile(r"^\s*([-+]?(?:\d+\.?\d*|\.\d+))\s*([a-z]*)\s*$")
+__ARC_PATTERN = re.compile(r"[Aa][^MmZzLlHhVvCcSsQqTt]*")
+
+
+def __minify_number(number: str) -> str:
+    """Minifies the number without changing its value.
+
+    Args:
+        number: The number in text.
+
+    Returns:
+        The number without the redundant zeros of `0.` and the fraction, and
+        without the plus sign. (e.g. `-0.500` -> `-.5`)
+    """
+    if "." not in number or "e" in number or "E" in number:
+        return number
+    sign = "-" if number.startswith("-") else ""
+    integer, _, fraction = number.lstrip("+-").partition(".")
+    if integer == "0":
+        integer = ""
+    fraction = fraction.rstrip("0")
+    minified = f"{integer}.{fraction}" if fraction else integer
+    return "0" if minified == "" else sign + minified
+
+
+def __minify_numbers(value: str) -> str:
+    """Minifies all numbers in the attribute value.
+
+    Args:
+        value: The attribute value.
+
+    Returns:
+        The attribute value with the minified numbers.
+
+    Notes:
+        A space is inserted if a number loses its decimal point but is followed by
+        another number starting with a decimal point (e.g. `1.0.5` -> `1 .5`), or if
+        a number loses its sign just after another number (e.g. `1-0.0` -> `1 0`).
+    """
+    minified = []
+    last_end = 0
+    for match in __NUMBER_PATTERN.finditer(value):
+        minified.append(value[last_end : match.start()])
+        number = __minify_number(match.group(0))
+        if (
+            match.group(0)[0] in "+-"
+            and not number.startswith("-")
+            and match.start() > 0
+            and (value[match.start() - 1].isdigit() or value[match.start() - 1] == ".")
+        ):
+            number = " " + number
+        if "." not in number and value.startswith(".", match.end()):
+            number += " "
+        minified.append(number)
+        last_end = match.end()
+    minified.append(value[last_end:])
+    return "".join(minified)
+
+
+def __minify_path(path: str) -> str:
+    """Minifies the numbers in the path data except for the arguments of arcs.
+
+    Args:
+        path: The path data.
+
+    Returns:
+        The path data with the minified numbers.
+
+    Notes:
+        The arguments of arc commands are kept as they are, since their flags may
+        be written without separators. (e.g. `a5 5 0 01.5.5`)
+    """
+    minified = []
+    last_end = 0
+    for match in __ARC_PATTERN.finditer(path):
+        minified.append(__minify_numbers(path[last_end : match.start()]))
+        minified.append(match.group(0))
+        last_end = match.end()
+    minified.append(__minify_numbers(path[last_end:]))
+    return "".join(minified)
+
+
+def __to_user_units(length: str | None) -> float | None:
+    """Converts the absolute length to user units.
+
+    Args:
+        length: The length with an optional unit.
+
+    Returns:
+        The length in user units, or None if it is missing or relative.
+    """
+    if length is None or (match := __LENGTH_PATTERN.match(length)) is None:
+        return None
+    number, unit = match.groups()
+    if unit not in SVG_UNITS:
+        return None
+    return float(number) * SVG_UNITS[unit]
+
+
+def __normalize_root(attributes: dict[str, str], size: int) -> dict[str, str]:
+    """Normalizes the attributes of the root element to the given size.
+
+    Args:
+        attributes: The attributes of the root element.
+        size: The width and height of the normalized image.
+
+    Returns:
+        The attributes with the new width and height, and the view box that keeps
+        the original coordinates.
+
+    Raises:
+        ValueError: If the view box is missing and cannot be derived from the
+            absolute width and height.
+    """
+    if "viewBox" not in attributes:
+        width = __to_user_units(attributes.get("width"))
+        height = __to_user_units(attributes.get("height"))
+        if width is None or height is None:
+            raise ValueError(
+                "Cannot resize the SVG image without the view box or absolute size"
+            )
+        attributes["viewBox"] = f"0 0 {width:g} {height:g}"
+    attributes["width"] = str(size)
+    attributes["height"] = str(size)
+    return attributes
+
+
+def normalize_svg(svg: bytes, size: int) -> bytes:
+    """Normalizes the SVG image to the given size without rendering it.
+
+    The root element gets the new width and height, with the view box of the
+    original coordinates. The declarations, comments, metadata and everything in
+    the namespaces of editors are stripped, and the redundant zeros of the numbers
+    in the geometric attributes are removed without rounding them.
+
+    Args:
+        svg: The bytes of the SVG image.
+        size: The width and height of the normalized image.
+
+    Returns:
+        The bytes of the normalized SVG image encoded in UTF-8.
+
+    Raises:
+        ValueError: If the SVG image is not well-formed, or its size is unknown.
+    """
+    output: list[str] = []
+    # The map of prefix and namespace of each open element.
+    namespace_stack: list[dict[str, str]] = [dict()]
+    # The name of each open element which is not stripped.
+    element_stack: list[str] = []
+    is_start_tag_open = False
+    stripped_depth = 0
+
+    def get_namespace(name: str) -> str | None:
+        prefix = name.split(":", 1)[0] if ":" in name else ""
+        return namespace_stack[-1].get(prefix, None)
+
+    def is_stripped(name: str) -> bool:
+        if name.startswith("xmlns:"):
+            return namespace_stack[-1].get(name[6:]) in SVG_EDITOR_NAMESPACES
+        return ":" in name and get_namespace(name) in SVG_EDITOR_NAMESPACES
+
+    def close_start_tag() -> None:
+        nonlocal is_start_tag_open
+        if is_start_tag_open:
+            output.append(">")
+            is_start_tag_open = False
+
+    def start_element(name: str, attributes: dict[str, str]) -> None:
+        nonlocal is_start_tag_open, stripped_depth
+        namespaces = dict(namespace_stack[-1])
+        for key, value in attributes.items():
+            if key == "xmlns":
+                namespaces[""] = value
+            elif key.startswith("xmlns:"):
+                namespaces[key[6:]] = value
+        namespace_stack.append(namespaces)
+        if stripped_depth > 0 or is_stripped(name) or name in SVG_STRIPPED_ELEMENTS:
+            stripped_depth += 1
+            return
+        close_start_tag()
+        if len(element_stack) == 0:
+            attributes = __normalize_root(dict(attributes), size)
+        output.append(f"<{name}")
+        for key, value in attributes.items():
+            if is_stripped(key):
+                continue
+            if key == "d":
+                value = __minify_path(value)
+            elif key in SVG_NUMERIC_ATTRIBUTES:
+                value = __minify_numbers(value)
+            output.append(f" {key}={quoteattr(value)}")
+        element_stack.append(name)
+        is_start_tag_open = True
+
+    def end_element(name: str) -> None:
+        nonlocal is_start_tag_open, stripped_depth
+        namespace_stack.pop()
+        if stripped_depth > 0:
+            stripped_depth -= 1
+            return
+        element_stack.pop()
+        if is_start_tag_open:
+            output.append("/>")
+            is_start_tag_open = False
+        else:
+            output.append(f"</{name}>")
+
+    def character_data(data: str) -> None:
+        if stripped_depth > 0 or len(element_stack) == 0:
+            return
+        if data.strip() == "" and element_stack[-1] not in SVG_WHITESPACE_ELEMENTS:
+            return
+        close_start_tag()
+        output.append(escape(data))
+
+    parser = ParserCreate()
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+    try:
+        parser.Parse(svg, True)
+    except Exception as e:
+        raise ValueError(f"Invalid SVG image: {e}")
+    return "".join(output).encode()
@@ -7,6 +7,7 @@ from prompt_toolkit.completion import WordCompleter
 from prompt_toolkit.document import Document
 from prompt_toolkit.validation import Validator, ValidationError
 
+from libraries.models.lazy_info_map import LazyInfoMap
 from libraries.models.network import Network
 from libraries.models.terminals.id import Id
 
@@ -46,11 +47,12 @@ def get_network() -> Network:
     Returns:
         The network information if it exists, otherwise None.
     """
-    networks = sorted(
-        [network for network, _ in Network.get_info_list()],
-        key=lambda x: x.id,
-    )
-    network_ids = [network.id for network in networks if len(network.explorers) > 0]
+    networks = LazyInfoMap(Network)
+    network_ids = [
+        network_id
+        for network_id in networks.get_ids()
+        if len(networks.get_raw(network_id).get("explorers", [])) > 0
+    ]
     printf(
         HTML(
             "<b>Enter the network ID: </b>"
@@ -64,4 +66,4 @@ def get_network() -> Network:
         placeholder=str(network_ids[0]) if len(network_ids) != 0 else None,
         validator=NetworkValidator(network_ids),
     )
-    return next(filter(lambda x: x.id == Id(network_id), networks))
+    return networks.get(Id(network_id))
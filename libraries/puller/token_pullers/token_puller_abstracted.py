@@ -1,12 +1,12 @@
 from abc import ABCMeta, abstractmethod
 from asyncio import run
 from copy import deepcopy
-from json import dump, dumps
+from json import dumps
 from os import mkdir
 from os.path import exists
 from pathlib import Path
 from shutil import copy, rmtree
-from tempfile import NamedTemporaryFile, mkdtemp
+from tempfile import mkdtemp
 
 from prompt_toolkit import (
     print_formatted_text as printf,
@@ -19,8 +19,11 @@ from web3 import Web3, HTTPProvider
 from yarl import URL
 
 from libraries.models.asset import Asset
+from libraries.models.asset_index import AssetIndex
 from libraries.models.contract import Contract
+from libraries.models.enum_info import EnumInfo
 from libraries.models.image_info import ImageInfo
+from libraries.models.lazy_info_map import LazyInfoMap
 from libraries.models.network import Network
 from libraries.models.reference import Reference
 from libraries.models.reference_list import ReferenceList
@@ -28,12 +31,18 @@ from libraries.models.terminals.address import Address
 from libraries.models.terminals.id import Id
 from libraries.models.terminals.image_type import ImageType
 from libraries.models.terminals.tag import Tag
-from libraries.preprocess.image import downscale_png, downscale_svg, downscale_jpg
-from libraries.preprocess.runner import run_enum_preprocess
+from libraries.preprocess.image import (
+    PngEncodingProfile,
+    downscale_jpg_bytes,
+    downscale_png_bytes,
+    downscale_svg_bytes,
+    write_images,
+)
+from libraries.preprocess.enum_store import EnumStore
 from libraries.puller.getters.id_getter import get_id
 from libraries.puller.getters.token_count_getter import get_token_count
 from libraries.utils.eth_erc20 import EthErc20Interface
-from libraries.utils.file import PWD
+from libraries.utils.file import PWD, write_json
 
 ETH_REFERENCE_BASE: dict[Id, URL] = {
     Id("coingecko"): URL("https://www.coingecko.com/en/coins/"),
@@ -49,8 +58,9 @@ class TokenPullerAbstracted(metaclass=ABCMeta):
     """Abstracted class for token puller.
 
     Attributes:
-        all_assets: The map of assets managed by asset-info-v2.
-        network_assets: The map of assets in the given `self.network`.
+        all_assets: The lazy map of assets managed by asset-info-v2.
+        asset_index: The index of assets in the given `self.network`.
+        asset_enum: The enum information of assets updated by each saved asset.
         node_url: The node URL of the network.
         flag_image_pull: The flag for image pull.
         network: The network information.
@@ -58,8 +68,9 @@ class TokenPullerAbstracted(metaclass=ABCMeta):
         token_count: The token count for pulling.
     """
 
-    all_assets: dict[Id, Asset]
-    network_assets: dict[Address, Asset]
+    all_assets: LazyInfoMap[Asset]
+    asset_index: AssetIndex
+    asset_enum: EnumStore
     node_url: HttpUrl
     flag_image_pull: bool
     network: Network
@@ -72,6 +83,10 @@ class TokenPullerAbstracted(metaclass=ABCMeta):
         Args:
             network: The network information.
         """
+        # Assigned first, since it is saved by `__del__` even if this fails.
+        self.asset_enum = EnumStore.load(
+            Asset.get_info_category().get_enum_type().get_enum_path()
+        )
         clear()
         printf(HTML("<b>✶ Set puller ✶</b>"))
         self.network = network
@@ -89,12 +104,20 @@ class TokenPullerAbstracted(metaclass=ABCMeta):
         )
         self.__check_node_url(network, URL(str(self.node_url)))
         self.flag_image_pull = confirm("Do you want to pull images?")
-        self.all_assets, self.network_assets = self.__get_assets(self.network)
+        self.all_assets = LazyInfoMap(Asset)
+        self.asset_index = AssetIndex(
+            self.all_assets.filter(
+                lambda x: any(
+                    contract.get("network") == str(self.network.id)
+                    for contract in x.get("contracts", [])
+                )
+            )
+        )
 
     def __del__(self) -> None:
-        """Remove the temporary directory and run the enum preprocessing."""
+        """Remove the temporary directory and save the enum information of assets."""
         rmtree(self.tmp_dir)
-        run_enum_preprocess(Asset)
+        self.asset_enum.save()
         printf(HTML("<b>✶ End puller ✶</b>"))
 
     def run(self) -> None:
@@ -129,7 +152,7 @@ class TokenPullerAbstracted(metaclass=ABCMeta):
         printf(HTML(f"<b>  Symbol: {symbol}</b>"))
         printed_url = str(self._get_token_url(address)).replace("&", "&amp;")
         printf(HTML(f"<b>  Source: <skyblue>{printed_url}</skyblue></b>"))
-        info = self.network_assets.get(address, None)
+        info = self.asset_index.find_asset(self.network.id, address)
         if info is not None and not confirm("Would you like to renew the information?"):
             return None
         gen_info = (
@@ -218,28 +241,6 @@ class TokenPullerAbstracted(metaclass=ABCMeta):
                 printf(HTML(f"<red>Invalid node URL: {printed_url}</red>"))
                 raise ValueError("Invalid node URL")
 
-    @staticmethod
-    def __get_assets(network: Network) -> tuple[dict[Id, Asset], dict[Address, Asset]]:
-        """Get the asset information in the given network.
-
-        Args:
-            network: The network information.
-
-        Returns:
-            The tuple of asset map.
-            The first element is the map of all asset information.
-            The second element is the map of asset addresses and asset information.
-        """
-        all_assets = {asset.id: asset for asset, _ in Asset.get_info_list()}
-        network_assets: dict[Address, Asset] = {}
-        for asset in all_assets.values():
-            for contract in filter(lambda x: x.network == network.id, asset.contracts):
-                if contract.address in network_assets:
-                    raise ValueError(f"Duplicate address found: {contract.address}")
-                else:
-                    network_assets[contract.address] = asset
-        return all_assets, network_assets
-
     def __get_target_token_list(self) -> list[Address]:
         """Get the target token list from the top token list.
 
@@ -249,7 +250,7 @@ class TokenPullerAbstracted(metaclass=ABCMeta):
         top_token_list = sorted(self._get_top_token_list(), key=lambda x: x[0])
         target_token_list = list()
         for _, token in top_token_list:
-            if asset := self.network_assets.get(token, None):
+            if asset := self.asset_index.find_asset(self.network.id, token):
                 if self.flag_image_pull and not asset.images.svg:
                     target_token_list.append(token)
             else:
@@ -265,10 +266,8 @@ class TokenPullerAbstracted(metaclass=ABCMeta):
         Returns:
             The tuple of contract information.
         """
-        if (asset := self.network_assets.get(address, None)) is not None:
-            contract = next(
-                filter(lambda x: x.network == self.network.id, asset.contracts)
-            )
+        if (found := self.asset_index.find(self.network.id, address)) is not None:
+            _, contract = found
             return contract.address, contract.name, contract.symbol, contract.decimals
         assert self.network.engine.is_evm
         it = EthErc20Interface(self.node_url, str(address))
@@ -290,7 +289,7 @@ class TokenPullerAbstracted(metaclass=ABCMeta):
             The asset information if it is new or updated, otherwise None.
         """
         asset_id = get_id(
-            f"Enter the ID of asset", guide_id=set(self.all_assets.keys())
+            "Enter the ID of asset", guide_id=set(self.all_assets.get_ids())
         )
         if asset_id not in self.all_assets:
             contract = self.__pull_contract_information(address, name, symbol, decimals)
@@ -446,17 +445,9 @@ class TokenPullerAbstracted(metaclass=ABCMeta):
             The list of image type if the image is saved.
         """
         try:
-            with NamedTemporaryFile(
-                mode="w+b", dir=image_path, suffix="_origin.png"
-            ) as fp_origin:
-                # Save the original image
-                fp_origin.write(image)
-                fp_origin.flush()
-                # Downscale the image
-                return downscale_png(
-                    Path(image_path),
-                    Path(fp_origin.name),
-                )
+            return write_images(
+                image_path, downscale_png_bytes(image, PngEncodingProfile.fast())
+            )
         except Exception as e:
             printf(HTML(f"<red>{e}</red>"))
             return []
@@ -473,17 +464,9 @@ class TokenPullerAbstracted(metaclass=ABCMeta):
             The list of image type if the image is saved.
         """
         try:
-            with NamedTemporaryFile(
-                mode="w+b", dir=image_path, suffix="_origin.svg"
-            ) as fp_origin:
-                # Save the original image
-                fp_origin.write(image)
-                fp_origin.flush()
-                # Downscale the image
-                return downscale_svg(
-                    Path(image_path),
-                    Path(fp_origin.name),
-                )
+            return write_images(
+                image_path, downscale_svg_bytes(image, PngEncodingProfile.fast())
+            )
         except Exception as e:
             printf(HTML(f"<red>{e}</red>"))
             return []
@@ -500,17 +483,9 @@ class TokenPullerAbstracted(metaclass=ABCMeta):
             The list of image type if the image is saved.
         """
         try:
-            with NamedTemporaryFile(
-                mode="w+b", dir=image_path, suffix="_origin.jpg"
-            ) as fp_origin:
-                # Save the original image
-                fp_origin.write(image)
-                fp_origin.flush()
-                # Downscale the image
-                return downscale_jpg(
-                    Path(image_path),
-                    Path(fp_origin.name),
-                )
+            return write_images(
+                image_path, downscale_jpg_bytes(image, PngEncodingProfile.fast())
+            )
         except Exception as e:
             printf(HTML(f"<red>{e}</red>"))
             return []
@@ -525,17 +500,26 @@ class TokenPullerAbstracted(metaclass=ABCMeta):
         Args:
             info: The asset information.
             image_info: The tuple of image path and image type.
+
+        Raises:
+            NotSavedError: If any address is already used by another asset, or the
+                user does not save it.
         """
         new_info = deepcopy(info)
         for image_type in image_info[1] if image_info else []:
             new_info.images.set(image_type)
         printf(HTML(f"<grey>{dumps(new_info.model_dump(mode='json'))}</grey>"))
+        # Checked before anything is updated, so that nothing is half-saved.
+        for address in self.asset_index.get_duplicate_addresses(new_info):
+            printf(HTML(f"<red>Duplicate address found: {address}</red>"))
+            raise NotSavedError()
         if confirm("Would you like to save this asset information?"):
-            # Update all_assets and network_assets
-            self.all_assets.update({new_info.id: new_info})
-            for contract in new_info.contracts:
-                if contract.address in self.network_assets:
-                    self.network_assets.update({contract.address: new_info})
+            # Update all_assets and asset_index
+            self.all_assets.update(new_info)
+            self.asset_index.upsert(new_info)
+            self.asset_enum.upsert(
+                EnumInfo(value=new_info.id, description=new_info.name)
+            )
             # Get the path of the asset information
             path = (
                 Asset.get_info_category()
@@ -545,14 +529,10 @@ class TokenPullerAbstracted(metaclass=ABCMeta):
             if not exists(path):
                 mkdir(path)
             # Save the asset information
-            with open(path.joinpath("info.json"), "w") as fp:
-                dump(
-                    new_info.model_dump(mode="json", by_alias=True),
-                    fp,
-                    indent=2,
-                    sort_keys=True,
-                )
-                fp.write("\n")
+            write_json(
+                path.joinpath("info.json"),
+                new_info.model_dump(mode="json", by_alias=True),
+            )
             # Save the images
             for image_type in image_info[1] if image_info else []:
                 image_path = image_type.get_path(image_info[0])
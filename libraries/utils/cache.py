@@ -0,0 +1,175 @@
+import os
+import pickle
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Self
+
+from libraries.utils.file import PWD
+
+CACHE_FORMAT_VERSION: int = 2
+"""The version of the cache file format."""
+CACHE_DIR_ENV: str = "ASSET_INFO_CACHE_DIR"
+"""The environment variable of the directory of the persistent caches.
+(The persistent caches are disabled if it is set to an empty string.)"""
+
+
+def get_cache_dir() -> Path | None:
+    """Gets the directory of the persistent caches.
+
+    Returns:
+        The directory of the persistent caches, or None if they are disabled.
+
+    Notes:
+        If `CACHE_DIR_ENV` is not set, the caches are kept in `.cache` of the
+        repository if it is a git checkout, otherwise in the cache directory of the
+        user, so that nothing is written into an installed package.
+    """
+    if (cache_dir := os.environ.get(CACHE_DIR_ENV, None)) is not None:
+        return Path(cache_dir).resolve() if cache_dir != "" else None
+    if PWD.joinpath(".git").exists():
+        return PWD.resolve().joinpath(".cache")
+    user_cache_dir = os.environ.get("XDG_CACHE_HOME", "") or "~/.cache"
+    return Path(user_cache_dir).expanduser().resolve().joinpath("asset-info-v2")
+
+
+def hash_files(file_paths: list[Path]) -> str:
+    """Hashes the contents of the given files.
+
+    Args:
+        file_paths: The paths of the files to hash.
+
+    Returns:
+        The hex digest of the contents of the files in the given order.
+    """
+    digest = sha256()
+    for file_path in file_paths:
+        with open(file_path, "rb") as fp:
+            digest.update(fp.read())
+    return digest.hexdigest()
+
+
+class FileCache:
+    """A persistent cache of records derived from files.
+
+    Each entry is keyed on the resolved path of its source file, and checked with
+    the modification time, size and content hash of the file. If the modification
+    time or size differs, the content hash is compared before the entry is
+    regarded as stale.
+
+    Attributes:
+        cache_path: The path of the cache file.
+        fingerprint: The fingerprint of the code producing the records.
+        entries: The map of resolved file path and (mtime, size, hash, record) of
+            the file.
+        is_modified: Whether the entries are modified after loading.
+
+    Args:
+        cache_path: The path of the cache file.
+        fingerprint: The fingerprint of the code producing the records.
+        entries: The map of resolved file path and (mtime, size, hash, record) of
+            the file.
+    """
+
+    cache_path: Path
+    fingerprint: str
+    entries: dict[str, tuple[int, int, str, Any]]
+    is_modified: bool
+
+    def __init__(
+        self,
+        cache_path: Path,
+        fingerprint: str,
+        entries: dict[str, tuple[int, int, str, Any]] | None = None,
+    ) -> None:
+        self.cache_path = cache_path
+        self.fingerprint = fingerprint
+        self.entries = entries or dict()
+        self.is_modified = False
+        self.__pending_keys: dict[str, tuple[int, int, str]] = dict()
+
+    @staticmethod
+    def load(cache_path: Path, fingerprint: str) -> Self:
+        """Loads the cache from the given path.
+
+        Args:
+            cache_path: The path of the cache file.
+            fingerprint: The fingerprint of the code producing the records.
+
+        Returns:
+            The loaded cache, or an empty cache if the cache file is missing,
+            broken or made from a different fingerprint.
+        """
+        try:
+            with open(cache_path, "rb") as fp:
+                version, cached_fingerprint, entries = pickle.load(fp)
+            if version == CACHE_FORMAT_VERSION and cached_fingerprint == fingerprint:
+                return FileCache(cache_path, fingerprint, entries)
+        except Exception:
+            pass
+        return FileCache(cache_path, fingerprint)
+
+    def get(self, file_path: Path) -> Any | None:
+        """Gets the record of the file if it is up to date.
+
+        Args:
+            file_path: The path of the source file.
+
+        Returns:
+            The cached record if the file is not changed, otherwise None.
+        """
+        key = os.path.realpath(file_path)
+        stat = os.stat(file_path)
+        entry = self.entries.get(key, None)
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            return entry[3]
+        with open(file_path, "rb") as fp:
+            content_hash = sha256(fp.read()).hexdigest()
+        if entry is not None and entry[2] == content_hash:
+            self.entries[key] = (stat.st_mtime_ns, stat.st_size, content_hash, entry[3])
+            self.is_modified = True
+            return entry[3]
+        self.__pending_keys[key] = (stat.st_mtime_ns, stat.st_size, content_hash)
+        return None
+
+    def put(self, file_path: Path, record: Any) -> None:
+        """Puts the record of the file which is missed by `get`.
+
+        Args:
+            file_path: The path of the source file.
+            record: The record derived from the file.
+        """
+        key = os.path.realpath(file_path)
+        if (pending_key := self.__pending_keys.pop(key, None)) is not None:
+            self.entries[key] = pending_key + (record,)
+            self.is_modified = True
+
+    def save(self) -> None:
+        """Saves the cache atomically if it is modified.
+
+        Notes:
+            Entries of the removed files are dropped, and failures on writing
+            the cache are ignored since the cache is only an optimization.
+        """
+        for key in [key for key in self.entries if not os.path.isfile(key)]:
+            del self.entries[key]
+            self.is_modified = True
+        if not self.is_modified:
+            return
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_path.parent, exist_ok=True)
+            with NamedTemporaryFile(
+                mode="wb", dir=self.cache_path.parent, delete=False
+            ) as fp:
+                tmp_path = fp.name
+                pickle.dump(
+                    (CACHE_FORMAT_VERSION, self.fingerprint, self.entries),
+                    fp,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, self.cache_path)
+            self.is_modified = False
+        except OSError:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
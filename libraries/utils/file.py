@@ -1,29 +1,135 @@
+import json
 import os
+import re
 from pathlib import Path
-
-from libraries.utils.string import is_regex_in
+from tempfile import NamedTemporaryFile
+from typing import Any
 
 # Project Works Directory: /asset-info-v2/libraries/utils/../../
 PWD: Path = Path(os.path.join(os.path.dirname(os.path.realpath(__file__)), "../../"))
 
+INFO_FILE_DEPTH: int = 1
+"""The depth of files in each information directory (`<category>/<id>/<file>`)."""
+
+
+def scan(
+    base_dir: Path, patterns: list[str], max_depth: int | None = None
+) -> dict[str, list[Path]]:
+    """Scans for files matching any of the patterns in one traversal.
+
+    Args:
+        base_dir: The base directory to scan for files.
+        patterns: The regex patterns to search for files.
+        max_depth: The maximum depth of directories to scan. (Files directly in
+            the base directory have depth 0. If it is not given, all child
+            directories are scanned.)
+
+    Returns:
+        The map of each pattern and the sorted list of files matching it.
+
+    Notes:
+        Directories which cannot be scanned (e.g. a missing base directory) are
+        skipped as `os.walk` does.
+    """
+    compiled_patterns = {pattern: re.compile(pattern) for pattern in patterns}
+    scanned_files: dict[str, list[Path]] = {pattern: [] for pattern in patterns}
+    dir_stack: list[tuple[str, int]] = [(str(base_dir), 0)]
+    while dir_stack:
+        dir_path, depth = dir_stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink() and (
+                        max_depth is None or depth < max_depth
+                    ):
+                        dir_stack.append((entry.path, depth + 1))
+                    continue
+                for pattern, compiled_pattern in compiled_patterns.items():
+                    if compiled_pattern.search(entry.name):
+                        scanned_files[pattern].append(Path(entry.path))
+    for files in scanned_files.values():
+        files.sort()
+    return scanned_files
+
 
-def search(base_dir: Path, pattern: str) -> list[Path]:
+def search(base_dir: Path, pattern: str, max_depth: int | None = None) -> list[Path]:
     """Searches for files in the given directory and its child directories.
 
     Args:
         base_dir: The base directory to search for files.
         pattern: The regex pattern to search for files.
+        max_depth: The maximum depth of directories to search.
 
     Returns:
         A list of files' information.
     """
-    searched_files = []
-    for path, _, files in os.walk(base_dir):
-        searched_files.extend(
-            [
-                Path(os.path.join(path, file))
-                for file in files
-                if is_regex_in(file, pattern)
-            ]
-        )
-    return searched_files
+    return scan(base_dir, [pattern], max_depth)[pattern]
+
+
+def dump_canonical_json(data: Any) -> bytes:
+    """Dumps the data to the canonical JSON of this repository.
+
+    Args:
+        data: The JSON-serializable data.
+
+    Returns:
+        The JSON indented by 2 spaces with sorted keys and a trailing newline.
+    """
+    return (json.dumps(data, indent=2, sort_keys=True) + "\n").encode()
+
+
+def write_if_changed(file_path: Path, content: bytes) -> bool:
+    """Writes the content to the file atomically only if the content differs.
+
+    Args:
+        file_path: The path of the file.
+        content: The content to write.
+
+    Returns:
+        True if the file is written, False if it already has the content.
+
+    Notes:
+        The content is written to a temporary file in the same directory, which
+        then replaces the file, so that the file is never left half-written. The
+        permissions of the existing file are kept.
+    """
+    mode = 0o644
+    try:
+        with open(file_path, "rb") as fp:
+            if fp.read() == content:
+                return False
+            mode = os.stat(fp.fileno()).st_mode & 0o777
+    except FileNotFoundError:
+        pass
+    tmp_path = None
+    try:
+        with NamedTemporaryFile(
+            mode="wb", dir=Path(file_path).parent, delete=False
+        ) as fp:
+            tmp_path = fp.name
+            fp.write(content)
+        # Temporary files are created only readable by the owner.
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return True
+
+
+def write_json(file_path: Path, data: Any) -> bool:
+    """Writes the data to the file in the canonical JSON only if it differs.
+
+    Args:
+        file_path: The path of the file.
+        data: The JSON-serializable data.
+
+    Returns:
+        True if the file is written, False if it already has the same JSON.
+    """
+    return write_if_changed(file_path, dump_canonical_json(data))
@@ -5,7 +5,7 @@ import pytest
 from libraries.models.asset import Asset
 from libraries.models.network import Network
 from libraries.models.protocol import Protocol
-from tests.utils.checker import check_images_validity, check_info_json_existence
+from tests.utils.checker import check_images_validity_list, check_info_json_existence
 from tests.utils.reader import read_models
 
 
@@ -36,17 +36,20 @@ class TestAdditionalFile:
     @pytest.mark.image
     def test_all_asset_image_valid(self):
         """All assets' images are valid."""
-        for asset, file in self.asset_list:
-            check_images_validity(asset.images, file)
+        check_images_validity_list(
+            [(asset.images, file) for asset, file in self.asset_list]
+        )
 
     @pytest.mark.image
     def test_all_network_image_exists(self):
         """All networks' images are valid."""
-        for network, file in self.network_list:
-            check_images_validity(network.images, file)
+        check_images_validity_list(
+            [(network.images, file) for network, file in self.network_list]
+        )
 
     @pytest.mark.image
     def test_all_protocol_image_exists(self):
         """All protocols' images are valid."""
-        for protocol, file in self.protocol_list:
-            check_images_validity(protocol.images, file)
+        check_images_validity_list(
+            [(protocol.images, file) for protocol, file in self.protocol_list]
+        )
@@ -0,0 +1,42 @@
+from libraries.models.terminals.address_bitcoin import AddressBitcoin
+
+LEGACY_ADDRESS: str = "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa"
+"""The legacy address."""
+SEGWIT_ADDRESS: str = "bc1qvt5s0v2uhuna2sjnn84ldu8m2r4m3rcc4048ry"
+"""The SegWit address of the same public key hash as `LEGACY_ADDRESS`."""
+SCRIPT_ADDRESS: str = "3J98t1WpEZ73CNmQviecrnyiWrnqRhWNLy"
+"""The script address of another public key hash."""
+
+
+class TestAddressBitcoin:
+    """Tests the order of Bitcoin addresses."""
+
+    def test_order_consistent_with_equality(self):
+        """Equal addresses are neither less nor greater than each other."""
+        address = AddressBitcoin(SEGWIT_ADDRESS)
+        other = AddressBitcoin(SEGWIT_ADDRESS.upper())
+        assert address == other
+        assert address <= other and address >= other
+        assert not address < other and not address > other
+
+    def test_order_of_same_public_key_hash(self):
+        """Different addresses of the same public key hash are strictly ordered."""
+        legacy = AddressBitcoin(LEGACY_ADDRESS)
+        segwit = AddressBitcoin(SEGWIT_ADDRESS)
+        assert legacy.public_key_hash == segwit.public_key_hash
+        assert legacy != segwit
+        assert legacy < segwit and legacy <= segwit
+        assert segwit > legacy and segwit >= legacy
+
+    def test_order_by_public_key_hash(self):
+        """Addresses are ordered by their public key hash first."""
+        addresses = [
+            AddressBitcoin(SCRIPT_ADDRESS),
+            AddressBitcoin(SEGWIT_ADDRESS),
+            AddressBitcoin(LEGACY_ADDRESS),
+        ]
+        assert [str(address) for address in sorted(addresses)] == [
+            LEGACY_ADDRESS,
+            SEGWIT_ADDRESS,
+            SCRIPT_ADDRESS,
+        ]
@@ -0,0 +1,134 @@
+import pytest
+
+from libraries.models.asset import Asset
+from libraries.models.asset_index import AssetIndex
+from libraries.models.terminals.address import Address
+from libraries.models.terminals.id import Id
+
+AAVE_ADDRESS: str = "0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9"
+"""The address of the AAVE contract in the Ethereum network."""
+USDC_ADDRESS: str = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+"""The address of the USDC contract in the Ethereum network."""
+USDC_OP_ADDRESS: str = "0x0b2C639c533813f4Aa9D7837CAf62653d097Ff85"
+"""The address of the USDC contract in the Optimism network."""
+
+
+def make_asset(asset_id: str, contracts: list[tuple[str, str, str]]) -> Asset:
+    """Makes the asset information with the given contracts.
+
+    Args:
+        asset_id: The asset ID.
+        contracts: The list of network ID, address and symbol of each contract.
+
+    Returns:
+        The asset information.
+    """
+    name = f"{asset_id.split('-')[0].upper()} Token"
+    return Asset.model_validate(
+        {
+            "contracts": [
+                {
+                    "address": address,
+                    "decimals": 18,
+                    "name": name,
+                    "network": network,
+                    "symbol": symbol,
+                    "tags": ["mainnet"],
+                }
+                for network, address, symbol in contracts
+            ],
+            "id": asset_id,
+            "images": {
+                "png128": False,
+                "png256": False,
+                "png32": False,
+                "png64": False,
+                "svg": False,
+            },
+            "name": name,
+            "references": [],
+            "tags": [],
+        }
+    )
+
+
+class TestAssetIndex:
+    """Tests the in-memory index of asset information."""
+
+    def test_upsert(self):
+        """The inserted asset is found by its ID, address and symbol."""
+        index = AssetIndex()
+        usdc = make_asset(
+            "usdc-0",
+            [("evm-1", USDC_ADDRESS, "USDC"), ("evm-10", USDC_OP_ADDRESS, "USDC")],
+        )
+        index.upsert(usdc)
+        assert len(index) == 1 and Id("usdc-0") in index
+        assert index.get_asset(Id("usdc-0")) == usdc
+        assert index.find_asset(Id("evm-10"), Address(USDC_OP_ADDRESS)) == usdc
+        assert index.get_assets_by_symbol("USDC") == [usdc]
+        assert [contract.address for contract in index.get_contracts(Id("evm-1"))] == [
+            Address(USDC_ADDRESS)
+        ]
+
+    def test_upsert_replaces(self):
+        """The replaced asset leaves no entries of its old contracts."""
+        index = AssetIndex(
+            [
+                make_asset(
+                    "usdc-0",
+                    [
+                        ("evm-1", USDC_ADDRESS, "USDC"),
+                        ("evm-10", USDC_OP_ADDRESS, "USDC.e"),
+                    ],
+                )
+            ]
+        )
+        usdc = make_asset("usdc-0", [("evm-1", USDC_ADDRESS, "USDC")])
+        index.upsert(usdc)
+        assert len(index) == 1
+        assert index.find(Id("evm-10"), Address(USDC_OP_ADDRESS)) is None
+        assert Id("evm-10") not in index.contracts
+        assert "USDC.e" not in index.symbols
+        assert index.find_asset(Id("evm-1"), Address(USDC_ADDRESS)) == usdc
+
+    def test_remove(self):
+        """The removed asset leaves no empty symbol and network entries."""
+        aave = make_asset("aave-0", [("evm-1", AAVE_ADDRESS, "AAVE")])
+        usdc = make_asset(
+            "usdc-0",
+            [("evm-1", USDC_ADDRESS, "USDC"), ("evm-10", USDC_OP_ADDRESS, "USDC")],
+        )
+        index = AssetIndex([aave, usdc])
+        assert index.remove(Id("usdc-0")) == usdc
+        assert index.remove(Id("usdc-0")) is None
+        assert index.get_asset_ids() == {Id("aave-0")}
+        assert index.symbols == {"AAVE": {Id("aave-0"): aave}}
+        assert list(index.contracts) == [Id("evm-1")]
+        assert index.get_contracts(Id("evm-10")) == []
+        assert index.get_assets_by_symbol("USDC") == []
+
+    def test_duplicate_rejected(self):
+        """The asset with an address of another asset is rejected unchanged."""
+        usdc = make_asset("usdc-0", [("evm-1", USDC_ADDRESS, "USDC")])
+        index = AssetIndex([usdc])
+        fake = make_asset(
+            "fake-0",
+            [("evm-1", AAVE_ADDRESS, "FAKE"), ("evm-1", USDC_ADDRESS, "FAKE")],
+        )
+        assert index.get_duplicate_addresses(fake) == [Address(USDC_ADDRESS)]
+        with pytest.raises(ValueError):
+            index.upsert(fake)
+        assert Id("fake-0") not in index
+        assert index.find(Id("evm-1"), Address(AAVE_ADDRESS)) is None
+        assert "FAKE" not in index.symbols
+        assert index.find_asset(Id("evm-1"), Address(USDC_ADDRESS)) == usdc
+
+    def test_load(self):
+        """Every asset of the catalog is indexed by each of its contracts."""
+        index = AssetIndex.load()
+        assets = [asset for asset, _ in Asset.get_info_list()]
+        assert len(index) == len(assets)
+        for asset in assets:
+            for contract in asset.contracts:
+                assert index.find_asset(contract.network, contract.address) == asset
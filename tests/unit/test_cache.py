@@ -0,0 +1,100 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from libraries.utils.cache import CACHE_DIR_ENV, FileCache, get_cache_dir
+
+
+def write_file(file_path: Path, content: str, mtime_ns: int) -> None:
+    """Writes the file with the given modification time.
+
+    Args:
+        file_path: The path of the file.
+        content: The content of the file.
+        mtime_ns: The modification time of the file in nanoseconds.
+    """
+    file_path.write_text(content)
+    os.utime(file_path, ns=(mtime_ns, mtime_ns))
+
+
+class TestFileCache:
+    """Tests the persistent cache of records derived from files."""
+
+    def test_hit_after_save(self, tmp_path: Path):
+        """The record of an unchanged file is loaded from the saved cache."""
+        cache_path = tmp_path.joinpath("cache.pickle")
+        file_path = tmp_path.joinpath("info.json")
+        write_file(file_path, "{}", 1_000_000_000)
+        cache = FileCache.load(cache_path, "fingerprint")
+        assert cache.get(file_path) is None
+        cache.put(file_path, {"record": 1})
+        cache.save()
+        assert FileCache.load(cache_path, "fingerprint").get(file_path) == {"record": 1}
+
+    def test_resolved_key(self, tmp_path: Path):
+        """The same file is hit through an unresolved path."""
+        tmp_path.joinpath("dir").mkdir()
+        file_path = tmp_path.joinpath("info.json")
+        write_file(file_path, "{}", 1_000_000_000)
+        cache = FileCache(tmp_path.joinpath("cache.pickle"), "fingerprint")
+        cache.get(file_path)
+        cache.put(file_path, "record")
+        assert cache.get(tmp_path.joinpath("dir/../info.json")) == "record"
+
+    def test_touched_file(self, tmp_path: Path):
+        """The record is kept if only the modification time of the file changed."""
+        file_path = tmp_path.joinpath("info.json")
+        write_file(file_path, "{}", 1_000_000_000)
+        cache = FileCache(tmp_path.joinpath("cache.pickle"), "fingerprint")
+        cache.get(file_path)
+        cache.put(file_path, "record")
+        write_file(file_path, "{}", 2_000_000_000)
+        assert cache.get(file_path) == "record"
+
+    def test_changed_file(self, tmp_path: Path):
+        """The record is stale if the content of the file changed."""
+        file_path = tmp_path.joinpath("info.json")
+        write_file(file_path, "{}", 1_000_000_000)
+        cache = FileCache(tmp_path.joinpath("cache.pickle"), "fingerprint")
+        cache.get(file_path)
+        cache.put(file_path, "record")
+        write_file(file_path, "[1]", 2_000_000_000)
+        assert cache.get(file_path) is None
+
+    def test_other_fingerprint(self, tmp_path: Path):
+        """The cache saved with another fingerprint is not loaded."""
+        cache_path = tmp_path.joinpath("cache.pickle")
+        file_path = tmp_path.joinpath("info.json")
+        write_file(file_path, "{}", 1_000_000_000)
+        cache = FileCache(cache_path, "fingerprint")
+        cache.get(file_path)
+        cache.put(file_path, "record")
+        cache.save()
+        assert FileCache.load(cache_path, "other").get(file_path) is None
+
+    def test_removed_file(self, tmp_path: Path):
+        """The entries of the removed files are dropped on saving."""
+        cache_path = tmp_path.joinpath("cache.pickle")
+        file_path = tmp_path.joinpath("info.json")
+        write_file(file_path, "{}", 1_000_000_000)
+        cache = FileCache(cache_path, "fingerprint")
+        cache.get(file_path)
+        cache.put(file_path, "record")
+        file_path.unlink()
+        cache.save()
+        assert FileCache.load(cache_path, "fingerprint").entries == dict()
+
+
+class TestCacheDir:
+    """Tests the directory of the persistent caches."""
+
+    def test_cache_dir_from_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """The directory is moved by the environment variable."""
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+        assert get_cache_dir() == tmp_path.resolve()
+
+    def test_cache_disabled_by_env(self, monkeypatch: pytest.MonkeyPatch):
+        """The caches are disabled by the empty environment variable."""
+        monkeypatch.setenv(CACHE_DIR_ENV, "")
+        assert get_cache_dir() is None
@@ -0,0 +1,24 @@
+from libraries.models.asset import Asset
+from libraries.models.catalog import Catalog
+from libraries.models.network import Network
+from libraries.models.protocol import Protocol
+
+
+class TestCatalog:
+    """Tests the catalog of all information."""
+
+    def test_load_split(self):
+        """Each information of the catalog is in the list of its category."""
+        catalog = Catalog.load()
+        for model_type in [Asset, Network, Protocol]:
+            info_list = catalog.get_info_list(model_type)
+            assert len(info_list) > 0
+            assert all(type(info) is model_type for info, _ in info_list)
+            assert [file_path for _, file_path in info_list] == (
+                model_type.get_info_path_list()
+            )
+            assert all(
+                file_path.parent.parent
+                == model_type.get_info_category().get_model_dir_path()
+                for _, file_path in info_list
+            )
@@ -0,0 +1,121 @@
+import subprocess
+from json import dumps, loads
+from pathlib import Path
+
+import pytest
+
+from libraries.models.terminals.info_category import InfoCategory
+from libraries.preprocess import changes, enum_info, runner
+from libraries.preprocess.changes import (
+    get_changed_dir_list,
+    get_changed_path_list,
+    is_source_changed,
+)
+from libraries.preprocess.enum_store import EnumStore
+
+
+def git(repo_dir: Path, *args: str) -> None:
+    """Runs the git command in the repository.
+
+    Args:
+        repo_dir: The directory of the repository.
+        args: The arguments of the git command.
+    """
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@test", *args],
+        cwd=repo_dir,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Creates a git repository with two committed network directories.
+
+    Args:
+        tmp_path: The temporary directory.
+        monkeypatch: The fixture to patch the repository directory.
+
+    Returns:
+        The directory of the repository.
+    """
+    for name in ["kept-0", "removed-0"]:
+        tmp_path.joinpath("networks").joinpath(name).mkdir(parents=True)
+        tmp_path.joinpath(f"networks/{name}/info.json").write_text("{}")
+    tmp_path.joinpath(".gitignore").write_text("*.log\n")
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "init")
+    monkeypatch.setattr(changes, "PWD", tmp_path)
+    return tmp_path
+
+
+class TestChanges:
+    """Tests the detection of the changes since a git reference."""
+
+    def test_changed_paths(self, repo_dir: Path):
+        """Modified, removed and untracked files are changed, but ignored ones not."""
+        repo_dir.joinpath("networks/kept-0/info.json").write_text("[]")
+        repo_dir.joinpath("networks/removed-0/info.json").unlink()
+        repo_dir.joinpath("networks/added-0").mkdir()
+        repo_dir.joinpath("networks/added-0/info.json").write_text("{}")
+        repo_dir.joinpath("networks/kept-0/debug.log").write_text("")
+        changed_paths = get_changed_path_list("HEAD")
+        assert changed_paths == [
+            Path("networks/added-0/info.json"),
+            Path("networks/kept-0/info.json"),
+            Path("networks/removed-0/info.json"),
+        ]
+        assert not is_source_changed(changed_paths)
+        assert get_changed_dir_list(InfoCategory("networks"), changed_paths) == [
+            InfoCategory("networks").get_model_dir_path().joinpath(name)
+            for name in ["added-0", "kept-0", "removed-0"]
+        ]
+        assert get_changed_dir_list(InfoCategory("assets"), changed_paths) == []
+
+    def test_unknown_ref(self, repo_dir: Path):
+        """Comparing with an unknown reference fails."""
+        with pytest.raises(ValueError):
+            get_changed_path_list("unknown-ref")
+
+    def test_source_changed(self, repo_dir: Path, monkeypatch: pytest.MonkeyPatch):
+        """Everything is preprocessed if the sources of the preprocessing changed."""
+        repo_dir.joinpath("libraries").mkdir()
+        repo_dir.joinpath("libraries/image.py").write_text("")
+        repo_dir.joinpath("networks/kept-0/info.json").write_text("[]")
+        calls = list()
+        monkeypatch.setattr(runner, "run_preprocess", lambda **kwargs: calls.append(1))
+        monkeypatch.setattr(
+            runner, "run_image_preprocess", lambda *args, **kwargs: calls.append(2)
+        )
+        runner.run_changed_preprocess("HEAD")
+        assert calls == [1]
+
+    def test_removed_enum(
+        self,
+        repo_dir: Path,
+        tmp_path_factory: pytest.TempPathFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """The entry of the removed directory is deleted from the enum file."""
+        enum_path = tmp_path_factory.mktemp("enum").joinpath("network.json")
+        enum_path.write_text(
+            dumps(
+                [
+                    {"description": "Kept", "value": "kept-0"},
+                    {"description": "Removed", "value": "removed-0"},
+                ]
+            )
+        )
+        load = EnumStore.load
+        monkeypatch.setattr(
+            enum_info.EnumStore, "load", staticmethod(lambda _: load(enum_path))
+        )
+        monkeypatch.setattr(runner, "run_image_preprocess", lambda *args, **kwargs: 0)
+        monkeypatch.setattr(runner, "run_info_preprocess", lambda *args: None)
+        git(repo_dir, "rm", "-q", "-r", "networks/removed-0")
+        runner.run_changed_preprocess("HEAD")
+        assert loads(enum_path.read_text()) == [
+            {"description": "Kept", "value": "kept-0"}
+        ]
@@ -0,0 +1,37 @@
+from enum import StrEnum
+from typing import Self
+
+from libraries.models.templates.enum_model import EnumModel
+
+
+class _MyEnum(StrEnum):
+    A = "a"
+    B = "b"
+    C = "c"
+
+
+class MyEnumModel(EnumModel[_MyEnum]):
+    @classmethod
+    def ascending_list(cls) -> list[Self]:
+        return [MyEnumModel(enum) for enum in _MyEnum]
+
+
+class TestEnumModel:
+    """Tests the enum model template as documented."""
+
+    def test_order(self):
+        """The values are ordered as the ascending list."""
+        a = MyEnumModel("a")
+        b = MyEnumModel("b")
+        assert a < b and a <= b and b > a and b >= a
+        assert [str(value) for value in MyEnumModel.descending_list()] == [
+            "c",
+            "b",
+            "a",
+        ]
+
+    def test_equality(self):
+        """The models of the same value are equal."""
+        assert MyEnumModel("a") == MyEnumModel("a")
+        assert MyEnumModel("a") == "a"
+        assert MyEnumModel._of(_MyEnum.B).order == 1
@@ -0,0 +1,89 @@
+from json import dumps, loads
+from pathlib import Path
+
+from libraries.models.enum_info import EnumInfo
+from libraries.preprocess.enum_store import EnumStore
+
+
+def make_enum_info(value: str) -> EnumInfo:
+    """Makes the enum information of the value.
+
+    Args:
+        value: The value of the enum information.
+
+    Returns:
+        The enum information described by the value.
+    """
+    return EnumInfo(value=value, description=f"{value.capitalize()} Token")
+
+
+class TestEnumStore:
+    """Tests the enum store."""
+
+    def test_load_missing(self, tmp_path: Path):
+        """The enum store of a missing enum file is empty."""
+        store = EnumStore.load(tmp_path.joinpath("asset.json"))
+        assert len(store) == 0
+        assert not store.save()
+        assert not tmp_path.joinpath("asset.json").exists()
+
+    def test_load_unsorted(self, tmp_path: Path):
+        """The entries of the enum file are sorted by value on loading."""
+        enum_path = tmp_path.joinpath("asset.json")
+        enum_path.write_text(
+            dumps(
+                [{"description": "B", "value": "b"}, {"description": "A", "value": "a"}]
+            )
+        )
+        assert [entry["value"] for entry in EnumStore.load(enum_path).entries] == [
+            "a",
+            "b",
+        ]
+
+    def test_upsert(self, tmp_path: Path):
+        """The inserted entries are kept sorted and the same entry changes nothing."""
+        store = EnumStore(tmp_path.joinpath("asset.json"))
+        for value in ["dai", "aave", "usdc", "bnb"]:
+            store.upsert(make_enum_info(value))
+        assert [entry["value"] for entry in store.entries] == [
+            "aave",
+            "bnb",
+            "dai",
+            "usdc",
+        ]
+        assert store.save()
+        store.upsert(make_enum_info("dai"))
+        assert not store.is_modified
+        store.upsert(EnumInfo(value="dai", description="Dai Stablecoin"))
+        assert store.is_modified
+        assert len(store) == 4
+        assert store.entries[2] == {"description": "Dai Stablecoin", "value": "dai"}
+
+    def test_delete(self, tmp_path: Path):
+        """Only the existing entry is deleted."""
+        store = EnumStore(tmp_path.joinpath("asset.json"))
+        for value in ["aave", "bnb", "dai"]:
+            store.upsert(make_enum_info(value))
+        store.save()
+        store.delete("cake")
+        assert not store.is_modified
+        store.delete("bnb")
+        assert "bnb" not in store
+        assert [entry["value"] for entry in store.entries] == ["aave", "dai"]
+
+    def test_save(self, tmp_path: Path):
+        """The sorted entries are written only when they are modified."""
+        enum_path = tmp_path.joinpath("asset.json")
+        store = EnumStore(enum_path)
+        for value in ["usdc", "aave"]:
+            store.upsert(make_enum_info(value))
+        assert store.save()
+        assert not store.save()
+        assert loads(enum_path.read_text()) == [
+            {"description": "Aave Token", "value": "aave"},
+            {"description": "Usdc Token", "value": "usdc"},
+        ]
+        store = EnumStore.load(enum_path)
+        store.delete("aave")
+        store.upsert(make_enum_info("aave"))
+        assert not store.save()
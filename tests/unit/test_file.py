@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from libraries.utils.file import PWD, scan, search
+
+
+class TestFile:
+    """Tests the file utilities."""
+
+    def test_search_missing_dir(self, tmp_path: Path):
+        """Searching a missing directory finds no files."""
+        assert search(tmp_path.joinpath("missing"), r"^info\.json$") == []
+
+    def test_scan_max_depth(self, tmp_path: Path):
+        """Scanning finds the files matching each pattern up to the depth."""
+        tmp_path.joinpath("a/b").mkdir(parents=True)
+        for name in ["x.json", "a/x.json", "a/y.png", "a/b/x.json"]:
+            tmp_path.joinpath(name).touch()
+        scanned = scan(tmp_path, [r"\.json$", r"\.png$"], 1)
+        assert scanned[r"\.json$"] == [
+            tmp_path.joinpath("a/x.json"),
+            tmp_path.joinpath("x.json"),
+        ]
+        assert scanned[r"\.png$"] == [tmp_path.joinpath("a/y.png")]
+
+    def test_search_info_files(self):
+        """Searching the assets finds the information file of each directory."""
+        assets_dir = PWD.joinpath("assets")
+        assert len(search(assets_dir, r"^info\.json$", 1)) == len(
+            [path for path in assets_dir.iterdir() if path.is_dir()]
+        )
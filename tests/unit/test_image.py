@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image, ImageChops, ImageStat
+
+from libraries.preprocess.image import rasterize_svg, rasterize_svg_list
+from libraries.utils.file import PWD
+
+BASELINE_DIR_NAMES: list[str] = ["aave-0", "usdc-0"]
+"""The asset directories whose 256px images were rendered from their SVG images."""
+MAX_MEAN_DIFFERENCE: float = 1.0
+"""The maximum mean difference of each channel from the baseline image."""
+
+
+def read_svg(dir_name: str) -> bytes:
+    """Reads the SVG image of the asset directory.
+
+    Args:
+        dir_name: The name of the asset directory.
+
+    Returns:
+        The bytes of the SVG image.
+    """
+    with open(
+        PWD.joinpath("assets").joinpath(dir_name).joinpath("image.svg"), "rb"
+    ) as fp:
+        return fp.read()
+
+
+def get_mean_difference(image: Image.Image, other: Image.Image) -> float:
+    """Gets the largest mean difference of the channels of the images.
+
+    Args:
+        image: The image to compare.
+        other: The other image to compare.
+
+    Returns:
+        The largest mean difference of the channels.
+    """
+    return max(ImageStat.Stat(ImageChops.difference(image, other)).mean)
+
+
+class TestImage:
+    """Tests the rasterization of SVG images."""
+
+    @pytest.mark.image
+    @pytest.mark.parametrize("dir_name", BASELINE_DIR_NAMES)
+    def test_rasterize_svg_as_baseline(self, dir_name: str):
+        """The rasterized SVG image is the same as the baseline image."""
+        baseline_path = (
+            PWD.joinpath("assets").joinpath(dir_name).joinpath("image-256.png")
+        )
+        with Image.open(baseline_path) as baseline:
+            baseline_image = baseline.convert("RGBA")
+        image = rasterize_svg(read_svg(dir_name), 256)
+        assert image.size == baseline_image.size
+        assert get_mean_difference(image, baseline_image) <= MAX_MEAN_DIFFERENCE
+
+    @pytest.mark.image
+    def test_rasterize_svg_concurrently(self):
+        """Rasterizing SVG images in threads does not mix them up."""
+        svgs = [read_svg(dir_name) for dir_name in BASELINE_DIR_NAMES] * 8
+        expected = [rasterize_svg(svg, 256).tobytes() for svg in svgs]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            images = list(executor.map(lambda svg: rasterize_svg(svg, 256), svgs))
+        assert [image.tobytes() for image in images] == expected
+
+    @pytest.mark.image
+    def test_rasterize_svg_list(self):
+        """The SVG images rasterized in processes keep their order and pixels."""
+        svgs = [read_svg(dir_name) for dir_name in BASELINE_DIR_NAMES] * 4
+        images = rasterize_svg_list(svgs, 256, max_workers=2)
+        assert [image.size for image in images] == [(256, 256)] * len(svgs)
+        assert [image.tobytes() for image in images] == [
+            rasterize_svg(svg, 256).tobytes() for svg in svgs
+        ]
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import pytest
+
+from libraries.models.network import Network
+from libraries.preprocess import runner
+from libraries.preprocess.image_manifest import ImageManifest
+from libraries.utils.cache import CACHE_DIR_ENV
+
+
+class TestImageManifest:
+    """Tests the manifest of preprocessed images."""
+
+    def test_resolved_key(self, tmp_path: Path):
+        """The same directory is current through an unresolved path."""
+        dir_path = tmp_path.joinpath("asset")
+        dir_path.mkdir()
+        dir_path.joinpath("image-128.png").write_bytes(b"image")
+        manifest = ImageManifest(tmp_path.joinpath("manifest.json"), "fingerprint")
+        manifest.update(dir_path)
+        assert manifest.is_current(tmp_path.joinpath("asset/../asset"))
+        manifest.save()
+        loaded = ImageManifest.load(manifest.manifest_path, "fingerprint")
+        assert loaded.is_current(dir_path)
+
+    def test_removed_dir(self, tmp_path: Path):
+        """The entries of the removed directories are dropped on saving."""
+        dir_path = tmp_path.joinpath("asset")
+        dir_path.mkdir()
+        manifest = ImageManifest(tmp_path.joinpath("manifest.json"), "fingerprint")
+        manifest.update(dir_path)
+        dir_path.rmdir()
+        manifest.save()
+        assert ImageManifest.load(manifest.manifest_path, "fingerprint").entries == {}
+
+    def test_disabled_cache(self, monkeypatch: pytest.MonkeyPatch):
+        """No manifest is used if the persistent caches are disabled."""
+        manifests = list()
+
+        def create_downscaled_image_list(paths, workers, progress, manifest, *args):
+            manifests.append(manifest)
+            return []
+
+        monkeypatch.setenv(CACHE_DIR_ENV, "")
+        monkeypatch.setattr(
+            runner, "create_downscaled_image_list", create_downscaled_image_list
+        )
+        runner.run_image_preprocess(Network, info_list=[], use_store=False)
+        assert manifests == [None]
+
+    def test_cache_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """The manifest is kept in the directory of the persistent caches."""
+        manifests = list()
+
+        def create_downscaled_image_list(paths, workers, progress, manifest, *args):
+            manifests.append(manifest)
+            return []
+
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+        monkeypatch.setattr(
+            runner, "create_downscaled_image_list", create_downscaled_image_list
+        )
+        runner.run_image_preprocess(Network, info_list=[], use_store=False)
+        assert manifests[0].manifest_path == tmp_path.resolve().joinpath(
+            "image/networks.json"
+        )
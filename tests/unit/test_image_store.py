@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from libraries.models.terminals.image_type import ImageType
+from libraries.preprocess.image_store import ImageStore
+
+
+class TestImageStore:
+    """Tests the content-addressed store of preprocessed images."""
+
+    def test_put_and_get(self, tmp_path: Path):
+        """The stored images are got by the key of the source image."""
+        store = ImageStore(tmp_path, "fingerprint")
+        key = store.get_key(b"source")
+        assert store.get(key) is None
+        store.put(key, {ImageType.png128(): b"png"})
+        assert store.get(key) == {ImageType.png128(): b"png"}
+        assert ImageStore(tmp_path, "other").get(key) is None
+
+    def test_prune(self, tmp_path: Path):
+        """Only the entries of the other fingerprints are pruned."""
+        store = ImageStore(tmp_path, "fingerprint")
+        other = ImageStore(tmp_path, "other")
+        key = store.get_key(b"source")
+        other_key = other.get_key(b"source")
+        store.put(key, {ImageType.png128(): b"png"})
+        other.put(other_key, {ImageType.png128(): b"other"})
+        tmp_path.joinpath("stale.pickle").write_bytes(b"stale")
+        store.prune()
+        assert list(tmp_path.iterdir()) == [store.entry_dir]
+        assert store.get(key) == {ImageType.png128(): b"png"}
+        assert other.get(other_key) is None
@@ -0,0 +1,27 @@
+from pathlib import Path
+from shutil import copy
+
+import pytest
+
+from libraries.models.asset import Asset
+from libraries.models.lazy_info_map import LazyInfoMap
+from libraries.models.terminals.info_category import InfoCategory
+from libraries.utils.file import PWD
+
+
+class TestLazyInfoMap:
+    """Tests the lazy view of the information."""
+
+    def test_dir_without_info_skipped(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """The directories without the information file are skipped."""
+        asset_dir = tmp_path.joinpath("aave-0")
+        asset_dir.mkdir()
+        copy(PWD.joinpath("assets/aave-0/info.json"), asset_dir)
+        tmp_path.joinpath("empty-0").mkdir()
+        monkeypatch.setattr(InfoCategory, "get_model_dir_path", lambda _: tmp_path)
+        info_map = LazyInfoMap(Asset)
+        assert [str(info_id) for info_id in info_map.get_ids()] == ["aave-0"]
+        assert "empty-0" not in info_map
+        assert info_map.get("aave-0").id == "aave-0"
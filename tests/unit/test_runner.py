@@ -0,0 +1,100 @@
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from pathlib import Path
+from shutil import copy
+from threading import Event
+
+import pytest
+
+from libraries.models.asset import Asset
+from libraries.models.network import Network
+from libraries.models.protocol import Protocol
+from libraries.preprocess import runner
+from libraries.preprocess.image import PngEncodingProfile, create_downscaled_image_list
+from libraries.utils.file import PWD
+
+
+def copy_base_images(base_dir: Path, count: int) -> list[Path]:
+    """Copies a PNG base image of the catalog into new directories.
+
+    Args:
+        base_dir: The directory to create the new directories in.
+        count: The number of the new directories.
+
+    Returns:
+        The list of the copied base images.
+    """
+    base_image_path = next(
+        path
+        for path in sorted(PWD.joinpath("assets").glob("*/image-256.png"))
+        if not path.parent.joinpath("image.svg").exists()
+    )
+    base_image_paths = []
+    for idx in range(count):
+        dir_path = base_dir.joinpath(f"asset-{idx}")
+        dir_path.mkdir()
+        base_image_paths.append(Path(copy(base_image_path, dir_path)))
+    return base_image_paths
+
+
+class TestRunner:
+    """Tests the preprocessing runner."""
+
+    def test_create_images_cancelled(self, tmp_path: Path):
+        """No image is created after the cancel event is set."""
+        base_image_paths = copy_base_images(tmp_path, 4)
+        cancel = Event()
+        cancel.set()
+        with pytest.raises(CancelledError):
+            create_downscaled_image_list(base_image_paths, 1, cancel=cancel)
+        assert list(tmp_path.glob("*/image-128.png")) == []
+
+    def test_run_preprocess_fails_fast(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """A failed category cancels the images pending in the other categories."""
+        base_image_paths = copy_base_images(tmp_path, 64)
+        started = Event()
+        run_image_preprocess = runner.run_image_preprocess
+
+        def get_base_image_list_of_dirs(dir_paths: list[Path]) -> list[Path]:
+            if dir_paths[0].parent.name != "assets":
+                return []
+            started.set()
+            return base_image_paths
+
+        def run_failing_image_preprocess(model_type, **kwargs) -> None:
+            if model_type is Network:
+                assert started.wait(60)
+                raise ValueError("Broken image")
+            run_image_preprocess(
+                model_type, use_manifest=False, use_store=False, **kwargs
+            )
+
+        monkeypatch.setattr(
+            runner, "get_base_image_list_of_dirs", get_base_image_list_of_dirs
+        )
+        monkeypatch.setattr(
+            runner, "run_image_preprocess", run_failing_image_preprocess
+        )
+        monkeypatch.setattr(runner, "run_enum_preprocess", lambda *args: None)
+        monkeypatch.setattr(runner, "run_info_preprocess", lambda *args: None)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(runner.run_preprocess, 1)
+            with pytest.raises(ValueError) as error:
+                future.result(timeout=120)
+        assert "networks: ValueError: Broken image" in str(error.value)
+        assert "assets: CancelledError" in str(error.value)
+        assert len(list(tmp_path.glob("*/image-128.png"))) < len(base_image_paths)
+
+    def test_run_preprocess_profile(self, monkeypatch: pytest.MonkeyPatch):
+        """The PNG encoding profile is passed to the images of every category."""
+        profile_names = dict()
+
+        def run_image_preprocess(model_type, profile, **kwargs) -> None:
+            profile_names[model_type] = profile.name
+
+        monkeypatch.setattr(runner, "run_image_preprocess", run_image_preprocess)
+        monkeypatch.setattr(runner, "run_enum_preprocess", lambda *args: None)
+        monkeypatch.setattr(runner, "run_info_preprocess", lambda *args: None)
+        runner.run_preprocess(1, PngEncodingProfile.fast())
+        assert profile_names == {Asset: "fast", Network: "fast", Protocol: "fast"}
@@ -0,0 +1,82 @@
+import stat
+from pathlib import Path
+
+import pytest
+
+from libraries.models.asset import Asset
+from libraries.models.enum_info_list import EnumInfoList
+from libraries.models.network import Network
+from libraries.models.protocol import Protocol
+from libraries.models.snapshot import (
+    SNAPSHOT_FORMAT_VERSION,
+    SNAPSHOT_HEADER,
+    SNAPSHOT_MAGIC,
+    Snapshot,
+)
+from libraries.models.terminals.enum_type_id import EnumTypeId
+from libraries.models.terminals.enum_type_tag import EnumTypeTag
+from libraries.preprocess.snapshot import create_snapshot
+
+
+@pytest.fixture(scope="module")
+def snapshot_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Creates the snapshot of the catalog in a temporary directory.
+
+    Args:
+        tmp_path_factory: The factory of temporary directories.
+
+    Returns:
+        The path of the created snapshot file.
+    """
+    snapshot_path = tmp_path_factory.mktemp("snapshot").joinpath("catalog.snapshot")
+    create_snapshot(snapshot_path)
+    return snapshot_path
+
+
+class TestSnapshot:
+    """Tests the snapshot of the catalog."""
+
+    def test_created_file(self, snapshot_path: Path):
+        """The snapshot is readable by others and no temporary file is left."""
+        assert stat.S_IMODE(snapshot_path.stat().st_mode) == 0o644
+        assert list(snapshot_path.parent.iterdir()) == [snapshot_path]
+
+    def test_round_trip(self, snapshot_path: Path):
+        """The information and enum information lists are read back as they were."""
+        with Snapshot(snapshot_path) as snapshot:
+            for model_type in [Asset, Network, Protocol]:
+                info_list = model_type.get_info_list()
+                assert snapshot.get_ids(model_type.get_info_category()) == sorted(
+                    info.id for info, _ in info_list
+                )
+                for info, _ in info_list:
+                    assert snapshot.get_info(model_type, info.id) == info
+            for enum_type in EnumTypeId.ascending_list() + EnumTypeTag.ascending_list():
+                assert snapshot.get_enum_info_list(
+                    enum_type
+                ) == EnumInfoList.get_info_list(enum_type)
+
+    def test_missing_info(self, snapshot_path: Path):
+        """The information of an ID unknown in the category is None."""
+        network_id = Network.get_info_list()[0][0].id
+        with Snapshot(snapshot_path) as snapshot:
+            assert snapshot.get_network(network_id) is not None
+            assert snapshot.get_asset(network_id) is None
+
+    def test_bad_magic(self, tmp_path: Path):
+        """The file without the magic bytes is rejected."""
+        bad_path = tmp_path.joinpath("bad.snapshot")
+        bad_path.write_bytes(
+            SNAPSHOT_HEADER.pack(b"NOTASNAP", SNAPSHOT_FORMAT_VERSION, 2) + b"{}"
+        )
+        with pytest.raises(ValueError):
+            Snapshot(bad_path)
+
+    def test_bad_version(self, tmp_path: Path):
+        """The snapshot of an unsupported format version is rejected."""
+        bad_path = tmp_path.joinpath("bad.snapshot")
+        bad_path.write_bytes(
+            SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION + 1, 2) + b"{}"
+        )
+        with pytest.raises(ValueError):
+            Snapshot(bad_path)
@@ -0,0 +1,82 @@
+import pytest
+
+from libraries.preprocess.svg import normalize_svg
+
+SVG_NAMESPACE = 'xmlns="http://www.w3.org/2000/svg"'
+
+
+class TestSvg:
+    """Tests the normalization of SVG images."""
+
+    def test_tiny_numbers_kept(self):
+        """Numbers smaller than the view box are not rounded away."""
+        svg = (
+            f'<svg {SVG_NAMESPACE} viewBox="0 0 1 1">'
+            '<circle cx="0.5000" cy="0.50" r="0.0004"/></svg>'
+        )
+        assert (
+            normalize_svg(svg.encode(), 128)
+            == (
+                f'<svg {SVG_NAMESPACE} viewBox="0 0 1 1" width="128" height="128">'
+                '<circle cx=".5" cy=".5" r=".0004"/></svg>'
+            ).encode()
+        )
+
+    def test_numbers_minified(self):
+        """Redundant zeros and signs of numbers are removed without rounding."""
+        svg = (
+            f'<svg {SVG_NAMESPACE} viewBox="0 0 24 24">'
+            '<path d="M1.0.5L-0.250 +3.14159265-0.0 1e-3 2+3.0"/></svg>'
+        )
+        assert b'd="M1 .5L-.25 3.14159265 0 1e-3 2 3"' in normalize_svg(
+            svg.encode(), 64
+        )
+
+    def test_relative_root_rejected(self):
+        """The root without a view box and absolute size is rejected."""
+        svg = f'<svg {SVG_NAMESPACE} width="100%" height="100%"><rect/></svg>'
+        with pytest.raises(ValueError):
+            normalize_svg(svg.encode(), 128)
+
+    def test_arc_flags_kept(self):
+        """The arguments of arcs are kept, while the other numbers are minified."""
+        svg = (
+            f'<svg {SVG_NAMESPACE} viewBox="0 0 24 24">'
+            '<path d="M1.0 1.0a5 5 0 01.5.5L0.50 00.5A1 1 0 1 0 2.0 2.0z"/></svg>'
+        )
+        assert b'd="M1 1a5 5 0 01.5.5L.5 00.5A1 1 0 1 0 2.0 2.0z"' in normalize_svg(
+            svg.encode(), 64
+        )
+
+    def test_view_box_from_units(self):
+        """The view box is derived from the absolute size of the root."""
+        svg = f'<svg {SVG_NAMESPACE} width="1in" height="72pt"><rect/></svg>'
+        assert (
+            normalize_svg(svg.encode(), 128)
+            == (
+                f'<svg {SVG_NAMESPACE} width="128" height="128" viewBox="0 0 96 96">'
+                "<rect/></svg>"
+            ).encode()
+        )
+
+    def test_editor_data_stripped(self):
+        """Comments, metadata and the data of editors are stripped."""
+        svg = (
+            '<?xml version="1.0"?><!-- comment -->'
+            f'<svg {SVG_NAMESPACE} xmlns:inkscape="http://www.inkscape.org/'
+            'namespaces/inkscape" viewBox="0 0 2 2" inkscape:version="1.0">'
+            "<metadata><title>x</title></metadata>"
+            '<inkscape:grid/>\n  <g inkscape:label="layer"><text> a </text></g></svg>'
+        )
+        assert (
+            normalize_svg(svg.encode(), 32)
+            == (
+                f'<svg {SVG_NAMESPACE} viewBox="0 0 2 2" width="32" height="32">'
+                "<g><text> a </text></g></svg>"
+            ).encode()
+        )
+
+    def test_invalid_svg(self):
+        """The malformed SVG image is rejected."""
+        with pytest.raises(ValueError):
+            normalize_svg(b"<svg><g></svg>", 128)
@@ -1,13 +1,12 @@
 import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Type
-
-from PIL import Image
-from svgpathtools import svg2paths2
+from xml.etree.ElementTree import iterparse
 
 from libraries.models.abstractions.info_model import InfoModel
 from libraries.models.image_info import ImageInfo
-from libraries.models.terminals.image_type import ImageType
 
 
 def check_info_json_existence(model_type: Type[InfoModel]) -> None:
@@ -24,51 +23,99 @@ def check_info_json_existence(model_type: Type[InfoModel]) -> None:
         assert os.path.exists(sub_dir.joinpath("info.json"))
 
 
-def __check_image_existence(image_path: Path, existence: bool) -> None:
-    """Check if the image exists.
+PNG_SIGNATURE: bytes = b"\x89PNG\r\n\x1a\n"
+"""The signature at the beginning of PNG files."""
+PNG_IHDR: struct.Struct = struct.Struct(">8sI4sII")
+"""The signature, the length and type of the IHDR chunk, and the width and height."""
+
+
+def __read_png_size(image_path: Path) -> tuple[int, int]:
+    """Read the size of the PNG image from its header.
 
     Args:
         image_path: Path of the image.
-        existence: File object of the image.
+
+    Returns:
+        The width and height of the image.
     """
-    if existence:
-        assert os.path.isfile(image_path)
-    else:
-        assert not os.path.isfile(image_path)
+    with open(image_path, "rb") as fp:
+        header = fp.read(PNG_IHDR.size)
+    if len(header) < PNG_IHDR.size:
+        raise ValueError("Truncated PNG header")
+    signature, _, chunk_type, width, height = PNG_IHDR.unpack(header)
+    if signature != PNG_SIGNATURE or chunk_type != b"IHDR":
+        raise ValueError("Invalid PNG header")
+    return width, height
 
 
-def __check_image_size(image_type: ImageType, image_path: Path) -> None:
-    """Check if image size is correct.
+def __read_svg_size(image_path: Path) -> tuple[int, int]:
+    """Read the size of the SVG image from its root element.
 
     Args:
-        image_type: Type of the image.
         image_path: Path of the image.
+
+    Returns:
+        The width and height of the image.
+
+    Notes:
+        Only the beginning of the file is parsed until the root element is found.
     """
-    if image_type.is_png:
-        with Image.open(image_path) as img:
-            assert img.size[0] == image_type.size
-            assert img.size[1] == image_type.size
-    elif image_type.is_svg:
-        _, _, attributes = svg2paths2(image_path)
-        assert int(attributes["width"]) == image_type.size
-        assert int(attributes["height"]) == image_type.size
-    else:
-        raise AssertionError(f"Unknown image type: {image_type}")
+    for _, root in iterparse(image_path, events=("start",)):
+        return int(root.attrib["width"]), int(root.attrib["height"])
+    raise ValueError("No root element")
 
 
-def __check_image_preprocessed(image_info: ImageInfo) -> None:
-    """Check if all images are preprocessed.
+def __get_image_violations(image_info: ImageInfo, file: Path) -> list[str]:
+    """Get the violations of the images of the information.
 
     Args:
         image_info: Information of image.
+        file: File object of the information.
+
+    Returns:
+        The list of violations.
     """
-    exist_images = [
-        idx
-        for idx, image_type in enumerate(ImageType.ascending_list())
-        if image_info.get(image_type)
-    ]
-    max_image = 0 if len(exist_images) == 0 else max(exist_images) + 1
-    assert len(exist_images) == max_image
+    violations = []
+    # The existing image types should be the lowest ones: 0b0...01...1
+    mask = image_info.mask
+    if mask & (mask + 1) != 0:
+        violations.append(f"{file.parent}: images are not preprocessed")
+    for image_type, existence in image_info:
+        image_path = image_type.get_path(file.parent)
+        if existence != os.path.isfile(image_path):
+            violations.append(f"{image_path}: existence should be {existence}")
+        elif existence:
+            try:
+                if image_type.is_png:
+                    size = __read_png_size(image_path)
+                else:
+                    size = __read_svg_size(image_path)
+            except Exception as e:
+                violations.append(f"{image_path}: {type(e).__name__}: {e}")
+                continue
+            if size != (image_type.size, image_type.size):
+                violations.append(f"{image_path}: size should be {image_type.size}")
+    return violations
+
+
+def check_images_validity_list(targets: list[tuple[ImageInfo, Path]]) -> None:
+    """Check if all images of every information are valid.
+
+    Args:
+        targets: The list of information of image and file object of the information.
+
+    Notes:
+        The images are checked in parallel, and all violations are reported at once.
+    """
+    with ThreadPoolExecutor() as executor:
+        violations = [
+            violation
+            for violation_list in executor.map(
+                lambda target: __get_image_violations(*target), targets
+            )
+            for violation in violation_list
+        ]
+    assert len(violations) == 0, "\n".join(violations)
 
 
 def check_images_validity(image_info: ImageInfo, file: Path) -> None:
@@ -78,9 +125,4 @@ def check_images_validity(image_info: ImageInfo, file: Path) -> None:
         image_info: Information of image.
         file: File object of the image.
     """
-    __check_image_preprocessed(image_info)
-    for image_type, existence in image_info:
-        image_path = image_type.get_path(file.parent)
-        __check_image_existence(image_path, existence)
-        if existence:
-            __check_image_size(image_type, image_path)
+    check_images_validity_list([(image_info, file)])
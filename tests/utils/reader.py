@@ -1,9 +1,24 @@
+from functools import cache
 from pathlib import Path
 from typing import Type
 
 from pydantic import ValidationError
 
 from libraries.models.abstractions.info_model import InfoModel
+from libraries.models.catalog import Catalog
+
+
+@cache
+def __load_catalog() -> Catalog:
+    """Loads the catalog of all information once per test session.
+
+    Returns:
+        The catalog of all information.
+    """
+    try:
+        return Catalog.load()
+    except ValidationError as e:
+        raise AssertionError(f"Failed to validation the catalog\n{e}")
 
 
 def read_models[T: InfoModel](model_type: Type[T]) -> list[tuple[T, Path]]:
@@ -16,9 +31,9 @@ def read_models[T: InfoModel](model_type: Type[T]) -> list[tuple[T, Path]]:
         A list of validated models.
     """
     try:
-        model_list = model_type.get_info_list()
-    except ValidationError as e:
-        raise AssertionError(f"Failed to validation {model_type}\n{e}")
+        model_list = __load_catalog().get_info_list(model_type)
+    except ValueError as e:
+        raise AssertionError(str(e))
     for model, file in model_list:
         if model.id != file.parent.name:
             raise AssertionError(